@@ -3395,6 +3395,7 @@ export interface ClusterSuggestion {
 }
 
 export interface ClusterResult {
+  run_id: string;
   cluster_count: number;
   total_untagged: number;
   noise_count: number;
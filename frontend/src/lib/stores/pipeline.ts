@@ -83,6 +83,9 @@ function createPipelineStore() {
 						clap: data.data.clap || null,
 						stats: data.data.stats || null
 					}));
+				} else if (data.type === 'pipeline_delta') {
+					// Only the top-level keys that changed since the last message
+					update((state) => ({ ...state, ...data.data }));
 				}
 			} catch (e) {
 				console.error('[PipelineStore] Parse error:', e);
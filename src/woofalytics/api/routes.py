@@ -10,8 +10,7 @@ This module provides endpoints for:
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from pathlib import Path
+from datetime import timedelta
 from typing import Annotated
 
 import structlog
@@ -37,9 +36,11 @@ from woofalytics.api.schemas import (
     PurgeResultSchema,
     RecentEventsSchema,
 )
+from woofalytics.api.utils import json_response, parse_ymd
 from woofalytics.config import Settings
 from woofalytics.detection.doa import angle_to_direction
 from woofalytics.detection.model import BarkDetector, BarkEvent
+from woofalytics.evidence.metadata import EvidenceMetadata
 from woofalytics.evidence.storage import EvidenceStorage
 from woofalytics.fingerprint.storage import FingerprintStore
 from woofalytics.observability.metrics import generate_latest, get_metrics
@@ -72,15 +73,7 @@ def get_evidence(request: Request) -> EvidenceStorage:
 
 
 def get_fingerprint_store(request: Request) -> FingerprintStore:
-    """Get fingerprint store from app state.
-
-    The store is lazily initialized on first access.
-    """
-    if not hasattr(request.app.state, "fingerprint_store"):
-        settings = request.app.state.settings
-        db_path = Path(settings.evidence.directory) / "fingerprints.db"
-        request.app.state.fingerprint_store = FingerprintStore(db_path)
-        logger.info("fingerprint_store_initialized", db_path=str(db_path))
+    """Get fingerprint store from app state."""
     return request.app.state.fingerprint_store
 
 
@@ -96,6 +89,22 @@ def bark_event_to_schema(event: BarkEvent) -> BarkEventSchema:
     )
 
 
+def evidence_to_schema(metadata: EvidenceMetadata) -> EvidenceFileSchema:
+    """Convert EvidenceMetadata to API schema."""
+    return EvidenceFileSchema(
+        filename=metadata.filename,
+        timestamp_utc=metadata.timestamp_utc,
+        timestamp_local=metadata.timestamp_local,
+        duration_seconds=metadata.duration_seconds,
+        sample_rate=metadata.sample_rate,
+        channels=metadata.channels,
+        trigger_probability=metadata.detection.trigger_probability,
+        peak_probability=metadata.detection.peak_probability,
+        bark_count_in_clip=metadata.detection.bark_count_in_clip,
+        doa_degrees=metadata.detection.doa_degrees,
+    )
+
+
 @router.get("/health", response_model=HealthSchema)
 async def health_check(
     detector: Annotated[BarkDetector, Depends(get_detector)],
@@ -209,7 +218,7 @@ async def get_recent_barks(
 async def list_evidence(
     evidence: Annotated[EvidenceStorage, Depends(get_evidence)],
     count: Annotated[int, Query(ge=1, le=100)] = 20,
-) -> EvidenceListSchema:
+) -> Response:
     """List recent evidence recordings.
 
     Args:
@@ -219,23 +228,8 @@ async def list_evidence(
     """
     recordings = evidence.get_recent_evidence(count)
 
-    files = [
-        EvidenceFileSchema(
-            filename=r.filename,
-            timestamp_utc=r.timestamp_utc,
-            timestamp_local=r.timestamp_local,
-            duration_seconds=r.duration_seconds,
-            sample_rate=r.sample_rate,
-            channels=r.channels,
-            trigger_probability=r.detection.trigger_probability,
-            peak_probability=r.detection.peak_probability,
-            bark_count_in_clip=r.detection.bark_count_in_clip,
-            doa_degrees=r.detection.doa_degrees,
-        )
-        for r in recordings
-    ]
-
-    return EvidenceListSchema(count=len(files), evidence=files)
+    files = [evidence_to_schema(r) for r in recordings]
+    return json_response(EvidenceListSchema(count=len(files), evidence=files))
 
 
 @router.get("/evidence/stats", response_model=EvidenceStatsSchema)
@@ -329,11 +323,11 @@ async def download_evidence(
     )
 
 
-@router.get("/evidence/date/{date}")
+@router.get("/evidence/date/{date}", response_model=EvidenceListSchema)
 async def get_evidence_by_date(
     date: str,
     evidence: Annotated[EvidenceStorage, Depends(get_evidence)],
-) -> EvidenceListSchema:
+) -> Response:
     """Get evidence recordings for a specific date.
 
     Args:
@@ -342,7 +336,8 @@ async def get_evidence_by_date(
     Returns evidence files from the specified date.
     """
     try:
-        target_date = datetime.strptime(date, "%Y-%m-%d")
+        # UTC-aware, so it compares against the index's timestamp_utc values
+        target_date = parse_ymd(date)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -354,23 +349,8 @@ async def get_evidence_by_date(
 
     recordings = evidence.get_evidence_by_date(start, end)
 
-    files = [
-        EvidenceFileSchema(
-            filename=r.filename,
-            timestamp_utc=r.timestamp_utc,
-            timestamp_local=r.timestamp_local,
-            duration_seconds=r.duration_seconds,
-            sample_rate=r.sample_rate,
-            channels=r.channels,
-            trigger_probability=r.detection.trigger_probability,
-            peak_probability=r.detection.peak_probability,
-            bark_count_in_clip=r.detection.bark_count_in_clip,
-            doa_degrees=r.detection.doa_degrees,
-        )
-        for r in recordings
-    ]
-
-    return EvidenceListSchema(count=len(files), evidence=files)
+    files = [evidence_to_schema(r) for r in recordings]
+    return json_response(EvidenceListSchema(count=len(files), evidence=files))
 
 
 @router.get("/config", response_model=ConfigurationSchema)
@@ -12,13 +12,14 @@ from datetime import datetime, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from woofalytics.api.schemas_export import (
     ExportEntrySchema,
     ExportResponseSchema,
     ExportStatsSchema,
 )
+from woofalytics.api.utils import json_response
 from woofalytics.evidence.metadata import EvidenceMetadata
 from woofalytics.evidence.storage import EvidenceStorage
 
@@ -88,11 +89,15 @@ async def export_json(
         le=1.0,
         description="Minimum confidence threshold (0.0-1.0)",
     ),
-) -> ExportResponseSchema:
+) -> Response:
     """Export bark events as JSON.
 
     Returns filtered bark event data as a JSON array.
     Useful for external analysis tools and integrations.
+
+    The export can hold every stored event, so the validated schema is
+    serialized directly with model_dump_json rather than re-validated and
+    run through jsonable_encoder by FastAPI.
     """
     entries = _filter_entries(
         evidence._index.entries,
@@ -101,7 +106,7 @@ async def export_json(
         min_confidence,
     )
 
-    return ExportResponseSchema(
+    export = ExportResponseSchema(
         count=len(entries),
         exported_at=datetime.now(timezone.utc),
         filters={
@@ -111,6 +116,7 @@ async def export_json(
         },
         entries=[_entry_to_schema(e) for e in entries],
     )
+    return json_response(export)
 
 
 @router.get("/csv")
@@ -8,12 +8,16 @@ This module provides endpoints for:
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import replace
 from datetime import datetime
-from pathlib import Path
 from typing import Annotated
+from uuid import uuid4
 
+import numpy as np
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from woofalytics.api.schemas_fingerprint import (
     BarkFingerprintSchema,
     BulkTagRequestSchema,
@@ -36,6 +40,7 @@ from woofalytics.api.schemas_fingerprint import (
     TagBarkRequestSchema,
     UntaggedBarksListSchema,
 )
+from woofalytics.api.utils import json_response
 from woofalytics.fingerprint.clustering import (
     ClusterSuggestion,
     create_clusterer,
@@ -49,6 +54,12 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(tags=["fingerprints"])
 
+# Number of recent clustering runs kept on app.state.cluster_runs, so a
+# suggestion can be turned into a dog without re-running HDBSCAN.
+CLUSTER_RUN_CACHE_SIZE = 8
+
+_dog_list_adapter = TypeAdapter(list[DogProfileSchema])
+
 
 # Dependency injection
 def get_settings(request: Request) -> Settings:
@@ -57,21 +68,22 @@ def get_settings(request: Request) -> Settings:
 
 
 def get_fingerprint_store(request: Request) -> FingerprintStore:
-    """Get fingerprint store from app state.
-
-    The store is lazily initialized on first access.
-    """
-    if not hasattr(request.app.state, "fingerprint_store"):
-        settings = request.app.state.settings
-        db_path = Path(settings.evidence.directory) / "fingerprints.db"
-        request.app.state.fingerprint_store = FingerprintStore(db_path)
-        logger.info("fingerprint_store_initialized", db_path=str(db_path))
+    """Get fingerprint store from app state."""
     return request.app.state.fingerprint_store
 
 
+def get_cluster_runs(request: Request) -> OrderedDict[str, dict[str, ClusterSuggestion]]:
+    """Get recent clustering runs (run_id -> cluster_id -> suggestion) from app state."""
+    return request.app.state.cluster_runs
+
+
 def _dog_to_schema(dog: DogProfile) -> DogProfileSchema:
-    """Convert DogProfile model to API schema."""
-    return DogProfileSchema(
+    """Convert DogProfile model to API schema.
+
+    Fields come from typed store rows, so the schema is built with
+    model_construct to skip re-validation.
+    """
+    return DogProfileSchema.model_construct(
         id=dog.id,
         name=dog.name,
         notes=dog.notes,
@@ -94,8 +106,12 @@ def _fingerprint_to_schema(
     fingerprint: BarkFingerprint,
     dog_name: str | None = None,
 ) -> BarkFingerprintSchema:
-    """Convert BarkFingerprint model to API schema."""
-    return BarkFingerprintSchema(
+    """Convert BarkFingerprint model to API schema.
+
+    Fields come from typed store rows, so the schema is built with
+    model_construct to skip re-validation.
+    """
+    return BarkFingerprintSchema.model_construct(
         id=fingerprint.id,
         timestamp=fingerprint.timestamp,
         dog_id=fingerprint.dog_id,
@@ -125,11 +141,14 @@ def _fingerprint_to_schema(
 )
 async def list_dogs(
     store: Annotated[FingerprintStore, Depends(get_fingerprint_store)],
-) -> list[DogProfileSchema]:
+) -> Response:
     """List all dog profiles."""
     dogs = store.list_dogs()
     logger.debug("dogs_listed", count=len(dogs))
-    return [_dog_to_schema(dog) for dog in dogs]
+    return Response(
+        content=_dog_list_adapter.dump_json([_dog_to_schema(dog) for dog in dogs]),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -255,7 +274,7 @@ async def get_dog_barks(
     dog_id: str,
     store: Annotated[FingerprintStore, Depends(get_fingerprint_store)],
     limit: Annotated[int, Query(ge=1, le=500)] = 100,
-) -> DogBarksListSchema:
+) -> Response:
     """Get bark fingerprints for a specific dog."""
     dog = store.get_dog(dog_id)
     if not dog:
@@ -263,12 +282,14 @@ async def get_dog_barks(
         raise HTTPException(status_code=404, detail="Dog not found")
 
     fingerprints = store.get_fingerprints_for_dog(dog_id, limit=limit)
-    return DogBarksListSchema(
-        dog_id=dog_id,
-        dog_name=dog.name,
-        count=len(fingerprints),
-        total_barks=dog.total_barks,
-        barks=[_fingerprint_to_schema(fp, dog.name) for fp in fingerprints],
+    return json_response(
+        DogBarksListSchema.model_construct(
+            dog_id=dog_id,
+            dog_name=dog.name,
+            count=len(fingerprints),
+            total_barks=dog.total_barks,
+            barks=[_fingerprint_to_schema(fp, dog.name) for fp in fingerprints],
+        )
     )
 
 
@@ -365,15 +386,16 @@ async def reset_dog_embedding(
 async def list_untagged_barks(
     store: Annotated[FingerprintStore, Depends(get_fingerprint_store)],
     limit: Annotated[int, Query(ge=1, le=500)] = 100,
-) -> UntaggedBarksListSchema:
+) -> Response:
     """List untagged bark fingerprints."""
-    fingerprints = store.get_untagged_fingerprints(limit=limit)
-    stats = store.get_stats()
+    fingerprints, total_untagged = store.list_untagged_fingerprints(limit=limit)
 
-    return UntaggedBarksListSchema(
-        count=len(fingerprints),
-        total_untagged=stats["untagged"],
-        barks=[_fingerprint_to_schema(fp) for fp in fingerprints],
+    return json_response(
+        UntaggedBarksListSchema.model_construct(
+            count=len(fingerprints),
+            total_untagged=total_untagged,
+            barks=[_fingerprint_to_schema(fp) for fp in fingerprints],
+        )
     )
 
 
@@ -435,6 +457,8 @@ async def bulk_tag_barks(
 
     tagged_count = 0
     failed_ids = []
+    embeddings = []
+    timestamps = []
 
     for bark_id in data.bark_ids:
         fingerprint = store.get_fingerprint(bark_id)
@@ -445,12 +469,16 @@ async def bulk_tag_barks(
         success = store.tag_fingerprint(bark_id, data.dog_id, data.confidence)
         if success:
             tagged_count += 1
-            # Update dog stats if the fingerprint has an embedding
+            # Collect embeddings so dog stats are updated once for the batch
             if fingerprint.embedding is not None:
-                store.update_dog_stats(data.dog_id, fingerprint.embedding, fingerprint.timestamp)
+                embeddings.append(fingerprint.embedding)
+                timestamps.append(fingerprint.timestamp)
         else:
             failed_ids.append(bark_id)
 
+    if embeddings:
+        store.update_dog_stats_batch(data.dog_id, np.stack(embeddings), timestamps)
+
     logger.info(
         "barks_bulk_tagged",
         dog_id=data.dog_id,
@@ -699,7 +727,7 @@ async def list_fingerprints(
     end_date: Annotated[
         datetime | None, Query(description="Filter by timestamp <= end_date")
     ] = None,
-) -> FingerprintListSchema:
+) -> Response:
     """List fingerprints with filtering and pagination."""
     fingerprints, total = store.list_fingerprints(
         limit=limit,
@@ -733,11 +761,13 @@ async def list_fingerprints(
         offset=offset,
     )
 
-    return FingerprintListSchema(
-        items=items,
-        total=total,
-        limit=limit,
-        offset=offset,
+    return json_response(
+        FingerprintListSchema.model_construct(
+            items=items,
+            total=total,
+            limit=limit,
+            offset=offset,
+        )
     )
 
 
@@ -750,7 +780,7 @@ async def list_fingerprints(
 )
 async def get_fingerprint_aggregates(
     store: Annotated[FingerprintStore, Depends(get_fingerprint_store)],
-) -> FingerprintAggregatesSchema:
+) -> Response:
     """Get aggregate acoustic statistics per dog."""
     aggregates = store.get_dog_acoustic_aggregates()
 
@@ -774,7 +804,7 @@ async def get_fingerprint_aggregates(
 
     logger.debug("fingerprint_aggregates_retrieved", dog_count=len(dogs))
 
-    return FingerprintAggregatesSchema(dogs=dogs)
+    return json_response(FingerprintAggregatesSchema(dogs=dogs))
 
 
 # --- Stats Endpoints ---
@@ -826,13 +856,16 @@ def _cluster_to_schema(
 )
 async def cluster_untagged_barks(
     store: Annotated[FingerprintStore, Depends(get_fingerprint_store)],
+    cluster_runs: Annotated[
+        OrderedDict[str, dict[str, ClusterSuggestion]], Depends(get_cluster_runs)
+    ],
     min_cluster_size: Annotated[
         int, Query(ge=2, le=20, description="Minimum barks to form a cluster")
     ] = 3,
     max_fingerprints: Annotated[
         int, Query(ge=10, le=5000, description="Maximum fingerprints to process")
     ] = 1000,
-) -> ClusterResultSchema:
+) -> Response:
     """Cluster untagged barks to suggest new dog profiles."""
     if not is_clustering_available():
         raise HTTPException(
@@ -842,12 +875,22 @@ async def cluster_untagged_barks(
         )
 
     try:
-        clusterer = create_clusterer(store, min_cluster_size=min_cluster_size)
+        clusterer = create_clusterer(
+            store,
+            min_cluster_size=min_cluster_size,
+            model_path=store.clusterer_model_path,
+        )
     except ImportError as e:
         raise HTTPException(status_code=501, detail=str(e)) from e
 
     suggestions = clusterer.cluster_untagged(max_fingerprints=max_fingerprints)
 
+    # Remember this run so create-dog can look clusters up without re-clustering
+    run_id = uuid4().hex[:12]
+    cluster_runs[run_id] = {s.cluster_id: s for s in suggestions}
+    while len(cluster_runs) > CLUSTER_RUN_CACHE_SIZE:
+        cluster_runs.popitem(last=False)
+
     # Get representative samples for each cluster
     suggestion_schemas = []
     for s in suggestions:
@@ -862,17 +905,21 @@ async def cluster_untagged_barks(
 
     logger.info(
         "clustering_completed",
+        run_id=run_id,
         cluster_count=len(suggestions),
         total_processed=total_untagged,
         clustered_count=clustered_count,
         noise_count=noise_count,
     )
 
-    return ClusterResultSchema(
-        cluster_count=len(suggestions),
-        total_untagged=total_untagged,
-        noise_count=max(0, noise_count),
-        suggestions=suggestion_schemas,
+    return json_response(
+        ClusterResultSchema(
+            run_id=run_id,
+            cluster_count=len(suggestions),
+            total_untagged=total_untagged,
+            noise_count=max(0, noise_count),
+            suggestions=suggestion_schemas,
+        )
     )
 
 
@@ -882,16 +929,17 @@ async def cluster_untagged_barks(
     status_code=201,
     summary="Create dog from cluster",
     description="Creates a new dog profile from a previously identified cluster. "
-    "All fingerprints in the cluster will be tagged to the new dog. The cluster "
-    "must be re-fetched if clustering has been run again.",
+    "All fingerprints in the cluster will be tagged to the new dog. The run_id "
+    "returned by the clustering request identifies which result to use; only the "
+    "most recent clustering runs are kept.",
 )
 async def create_dog_from_cluster(
     cluster_id: str,
     data: CreateDogFromClusterRequestSchema,
     store: Annotated[FingerprintStore, Depends(get_fingerprint_store)],
-    min_cluster_size: Annotated[
-        int, Query(ge=2, le=20, description="Minimum barks to form a cluster")
-    ] = 3,
+    cluster_runs: Annotated[
+        OrderedDict[str, dict[str, ClusterSuggestion]], Depends(get_cluster_runs)
+    ],
 ) -> DogProfileSchema:
     """Create a dog profile from a cluster suggestion."""
     if not is_clustering_available():
@@ -901,32 +949,42 @@ async def create_dog_from_cluster(
             "Install with: pip install woofalytics[clustering]",
         )
 
-    try:
-        clusterer = create_clusterer(store, min_cluster_size=min_cluster_size)
-    except ImportError as e:
-        raise HTTPException(status_code=501, detail=str(e)) from e
-
-    # Re-run clustering to get the cluster data
-    # (Clusters are ephemeral - they exist only during clustering)
-    suggestions = clusterer.cluster_untagged()
-
-    # Find the requested cluster
-    target: ClusterSuggestion | None = None
-    for s in suggestions:
-        if s.cluster_id == cluster_id:
-            target = s
-            break
+    run = cluster_runs.get(data.run_id)
+    if run is None:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Clustering run '{data.run_id}' has expired. "
+            "Run clustering again to get updated clusters.",
+        )
+    cluster_runs.move_to_end(data.run_id)
 
+    target = run.get(cluster_id)
     if not target:
         raise HTTPException(
             status_code=404,
-            detail=f"Cluster '{cluster_id}' not found. "
-            "Clusters may have changed since last query. "
-            "Run clustering again to get updated clusters.",
+            detail=f"Cluster '{cluster_id}' not found in clustering run '{data.run_id}'.",
         )
 
-    # Create the dog from the cluster
+    # Barks may have been tagged, rejected or purged since the run; never move those
+    fingerprint_ids = store.filter_untagged_ids(target.fingerprint_ids)
+    if not fingerprint_ids:
+        run.pop(cluster_id, None)
+        raise HTTPException(
+            status_code=409,
+            detail=f"All barks in cluster '{cluster_id}' have been tagged or removed "
+            "since clustering. Run clustering again to get updated clusters.",
+        )
+    if len(fingerprint_ids) < len(target.fingerprint_ids):
+        target = replace(target, fingerprint_ids=fingerprint_ids, size=len(fingerprint_ids))
+
+    try:
+        clusterer = create_clusterer(store)
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e)) from e
+
+    # Create the dog from the cluster; a cluster can only become one dog
     dog_id = clusterer.create_dog_from_cluster(target, name=data.name, notes=data.notes)
+    run.pop(cluster_id, None)
 
     # Get the created dog
     dog = store.get_dog(dog_id)
@@ -6,14 +6,19 @@ Settings are persisted to config.yaml and require a restart to take effect.
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import os
 from pathlib import Path
 from typing import Annotated
 
 import structlog
 import yaml
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
+from woofalytics.api.utils import etag_matches, json_response
 from woofalytics.config import Settings
 
 logger = structlog.get_logger(__name__)
@@ -22,6 +27,27 @@ router = APIRouter(prefix="/settings", tags=["settings"])
 
 CONFIG_PATH = Path("config.yaml")
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_CONFIG_HEADER = """# Woofalytics Configuration
+# -------------------------
+# This file is managed by the Woofalytics settings UI.
+# Environment variables take precedence over this file.
+# Environment variables use the prefix WOOFALYTICS__ with __ as delimiter.
+# Example: WOOFALYTICS__MODEL__CLAP_THRESHOLD=0.7
+
+"""
+
+# Last parsed config.yaml as (st_mtime_ns, config). The file is only written
+# by this module, so an unchanged mtime means the parsed dict is still valid.
+_config_cache: tuple[int, dict] | None = None
+
+# GET /settings body and its ETag for the running Settings object. Settings
+# only change on restart, so the body is serialized once per instance.
+_settings_response_cache: tuple[Settings, bytes, str] | None = None
+
 
 # --- Schemas ---
 
@@ -117,9 +143,13 @@ def get_settings(request: Request) -> Settings:
 
 
 def _settings_to_schema(settings: Settings) -> AllSettingsSchema:
-    """Convert Settings to API schema."""
-    return AllSettingsSchema(
-        model=ModelSettingsSchema(
+    """Convert Settings to API schema.
+
+    Values come from an already-validated Settings object, so the schemas are
+    built with model_construct to skip re-validation.
+    """
+    return AllSettingsSchema.model_construct(
+        model=ModelSettingsSchema.model_construct(
             clap_threshold=settings.model.clap_threshold,
             clap_bird_veto_threshold=settings.model.clap_bird_veto_threshold,
             clap_min_harmonic_ratio=settings.model.clap_min_harmonic_ratio,
@@ -128,18 +158,18 @@ def _settings_to_schema(settings: Settings) -> AllSettingsSchema:
             yamnet_enabled=settings.model.yamnet_enabled,
             yamnet_threshold=settings.model.yamnet_threshold,
         ),
-        evidence=EvidenceSettingsSchema(
+        evidence=EvidenceSettingsSchema.model_construct(
             past_context_seconds=settings.evidence.past_context_seconds,
             future_context_seconds=settings.evidence.future_context_seconds,
             auto_record=settings.evidence.auto_record,
         ),
-        webhook=WebhookSettingsSchema(
+        webhook=WebhookSettingsSchema.model_construct(
             enabled=settings.webhook.enabled,
             ifttt_event=settings.webhook.ifttt_event,
             # Don't expose the actual key, just show if it's set
             ifttt_key="••••••••" if settings.webhook.ifttt_key else "",
         ),
-        quiet_hours=QuietHoursSettingsSchema(
+        quiet_hours=QuietHoursSettingsSchema.model_construct(
             enabled=settings.quiet_hours.enabled,
             start=settings.quiet_hours.start.strftime("%H:%M"),
             end=settings.quiet_hours.end.strftime("%H:%M"),
@@ -151,128 +181,144 @@ def _settings_to_schema(settings: Settings) -> AllSettingsSchema:
 
 
 def _load_config_yaml() -> dict:
-    """Load existing config.yaml or return empty dict."""
-    if CONFIG_PATH.exists():
+    """Load existing config.yaml or return empty dict.
+
+    The parsed result is cached by file mtime; callers get a deep copy they
+    are free to mutate.
+    """
+    global _config_cache
+
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _config_cache is None or _config_cache[0] != mtime_ns:
         with open(CONFIG_PATH, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
-    return {}
+            _config_cache = (mtime_ns, yaml.load(f, Loader=_YAML_LOADER) or {})
+
+    return copy.deepcopy(_config_cache[1])
 
 
 def _save_config_yaml(config: dict) -> None:
-    """Save config to config.yaml with comments preserved where possible."""
-    # Read existing file to preserve comments
-    header = """# Woofalytics Configuration
-# -------------------------
-# This file is managed by the Woofalytics settings UI.
-# Environment variables take precedence over this file.
-# Environment variables use the prefix WOOFALYTICS__ with __ as delimiter.
-# Example: WOOFALYTICS__MODEL__CLAP_THRESHOLD=0.7
+    """Save config to config.yaml, replacing the file atomically."""
+    global _config_cache
 
-"""
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        f.write(header)
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+    # Render in memory so the file is written with a single write call
+    body = yaml.dump(config, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+    data = (_CONFIG_HEADER + body).encode("utf-8")
+
+    tmp_path = CONFIG_PATH.with_suffix(".yaml.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, CONFIG_PATH)
+
+    _config_cache = (CONFIG_PATH.stat().st_mtime_ns, copy.deepcopy(config))
+
+
+def _merge_section(
+    config: dict,
+    section: str,
+    update: BaseModel,
+    sensitive_keys: tuple[str, ...] = (),
+) -> bool:
+    """Merge the fields a client sent for one settings section into config.
+
+    Sensitive keys are never overwritten with the masked placeholder or with
+    an empty string when a value is already stored, and are not logged.
+
+    Returns:
+        True if any value in the section changed.
+    """
+    current = config.setdefault(section, {})
+    changed = False
+
+    for key, value in update.model_dump(exclude_unset=True).items():
+        if key in sensitive_keys and (value.startswith("••") or (not value and current.get(key))):
+            continue
+        if current.get(key) != value:
+            current[key] = value
+            changed = True
+            log_value = "***" if key in sensitive_keys else value
+            logger.info("settings_updated", section=section, key=key, value=log_value)
+
+    return changed
 
 
 # --- Endpoints ---
 
 
+def _get_settings_body(settings: Settings) -> tuple[bytes, str]:
+    """Get the serialized GET /settings body and its ETag."""
+    global _settings_response_cache
+
+    if _settings_response_cache is None or _settings_response_cache[0] is not settings:
+        body = SettingsResponseSchema.model_construct(
+            settings=_settings_to_schema(settings),
+            config_path=str(CONFIG_PATH.absolute()),
+            restart_required=False,
+        ).model_dump_json().encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        _settings_response_cache = (settings, body, etag)
+
+    return _settings_response_cache[1], _settings_response_cache[2]
+
+
 @router.get("", response_model=SettingsResponseSchema)
 async def get_all_settings(
     settings: Annotated[Settings, Depends(get_settings)],
-) -> SettingsResponseSchema:
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Get current settings.
 
     Returns the editable subset of application settings.
-    Sensitive values like API keys are masked.
+    Sensitive values like API keys are masked. Supports conditional
+    requests: a matching If-None-Match returns 304 with no body.
     """
-    return SettingsResponseSchema(
-        settings=_settings_to_schema(settings),
-        config_path=str(CONFIG_PATH.absolute()),
-        restart_required=False,
-    )
+    body, etag = _get_settings_body(settings)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.put("", response_model=SettingsResponseSchema)
 async def update_settings(
     update: SettingsUpdateSchema,
     settings: Annotated[Settings, Depends(get_settings)],
-) -> SettingsResponseSchema:
+) -> Response:
     """Update settings.
 
     Changes are saved to config.yaml and require a restart to take effect.
     Only provided fields are updated; omitted sections are unchanged.
     """
-    # Load existing config
-    config = _load_config_yaml()
+    # Load existing config (file I/O runs in executor to keep the event loop free)
+    loop = asyncio.get_event_loop()
+    config = await loop.run_in_executor(None, _load_config_yaml)
 
     changes_made = False
-
-    # Update model settings
     if update.model is not None:
-        if "model" not in config:
-            config["model"] = {}
-
-        model_updates = update.model.model_dump()
-        for key, value in model_updates.items():
-            if config["model"].get(key) != value:
-                config["model"][key] = value
-                changes_made = True
-                logger.info("settings_updated", section="model", key=key, value=value)
-
-    # Update evidence settings
+        changes_made |= _merge_section(config, "model", update.model)
     if update.evidence is not None:
-        if "evidence" not in config:
-            config["evidence"] = {}
-
-        evidence_updates = update.evidence.model_dump()
-        for key, value in evidence_updates.items():
-            if config["evidence"].get(key) != value:
-                config["evidence"][key] = value
-                changes_made = True
-                logger.info("settings_updated", section="evidence", key=key, value=value)
-
-    # Update webhook settings
+        changes_made |= _merge_section(config, "evidence", update.evidence)
     if update.webhook is not None:
-        if "webhook" not in config:
-            config["webhook"] = {}
-
-        webhook_updates = update.webhook.model_dump()
-        for key, value in webhook_updates.items():
-            # Don't overwrite existing key with masked value
-            if key == "ifttt_key" and value.startswith("••"):
-                continue
-            # Don't overwrite with empty string if there's an existing key
-            if key == "ifttt_key" and not value and config["webhook"].get("ifttt_key"):
-                continue
-
-            if config["webhook"].get(key) != value:
-                config["webhook"][key] = value
-                changes_made = True
-                # Don't log sensitive values
-                log_value = "***" if key == "ifttt_key" else value
-                logger.info("settings_updated", section="webhook", key=key, value=log_value)
-
-    # Update quiet hours settings
+        changes_made |= _merge_section(
+            config, "webhook", update.webhook, sensitive_keys=("ifttt_key",)
+        )
     if update.quiet_hours is not None:
-        if "quiet_hours" not in config:
-            config["quiet_hours"] = {}
-
-        quiet_hours_updates = update.quiet_hours.model_dump()
-        for key, value in quiet_hours_updates.items():
-            if config["quiet_hours"].get(key) != value:
-                config["quiet_hours"][key] = value
-                changes_made = True
-                logger.info("settings_updated", section="quiet_hours", key=key, value=value)
+        changes_made |= _merge_section(config, "quiet_hours", update.quiet_hours)
 
     # Save to file
     if changes_made:
-        _save_config_yaml(config)
+        await loop.run_in_executor(None, _save_config_yaml, config)
         logger.info("config_file_saved", path=str(CONFIG_PATH))
 
-    return SettingsResponseSchema(
-        settings=_settings_to_schema(settings),
-        config_path=str(CONFIG_PATH.absolute()),
-        restart_required=changes_made,
-        message="Settings saved. Restart required for changes to take effect." if changes_made else None,
+    return json_response(
+        SettingsResponseSchema.model_construct(
+            settings=_settings_to_schema(settings),
+            config_path=str(CONFIG_PATH.absolute()),
+            restart_required=changes_made,
+            message="Settings saved. Restart required for changes to take effect." if changes_made else None,
+        )
     )
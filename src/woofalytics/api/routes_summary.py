@@ -6,22 +6,24 @@ with time-based breakdowns for analysis and reporting.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import time
-from calendar import monthrange
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated
 
 import httpx
+import jinja2
 import prompty
-from prompty.renderers import Jinja2Renderer
-
-# Get system local timezone
-LOCAL_TZ = datetime.now().astimezone().tzinfo
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
+from woofalytics import __version__
 from woofalytics.api.schemas_summary import (
     AISummarySchema,
     DailySummarySchema,
@@ -30,12 +32,16 @@ from woofalytics.api.schemas_summary import (
     RangeSummarySchema,
     WeeklySummarySchema,
 )
-from woofalytics.evidence.metadata import EvidenceMetadata
+from woofalytics.api.utils import etag_matches, json_response, parse_year_month, parse_ymd
+from woofalytics.evidence.metadata import LOCAL_TZ, DailyAggregate
 from woofalytics.evidence.storage import EvidenceStorage
 from woofalytics.fingerprint.storage import FingerprintStore
 
 router = APIRouter(prefix="/summary", tags=["summary"])
 
+# Mixed into summary ETags; bump when a summary's content changes for the same data
+SUMMARY_ETAG_VERSION = "1"
+
 # Ollama configuration
 OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "qwen2.5:3b")
@@ -43,6 +49,7 @@ OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "qwen2.5:3b")
 # Prompty configuration - load template once
 _PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 _weekly_summary_prompty: prompty.Prompty | None = None
+_weekly_summary_template: jinja2.Template | None = None
 
 
 # --- Dependency Injection ---
@@ -58,28 +65,52 @@ def get_fingerprint_store(request: Request) -> FingerprintStore:
     return request.app.state.fingerprint_store
 
 
+def get_ollama_client(request: Request) -> httpx.AsyncClient:
+    """Get the shared Ollama HTTP client from app state."""
+    return request.app.state.ollama_client
+
+
 # --- Helper Functions ---
 
 
+# Per-dog totals for a day range, read from the rollup via the covering
+# idx_rollup_dog_day index. Kept as one constant so every call binds the same
+# SQL text (and hits sqlite3's statement cache on a reused connection).
+_PER_DOG_BARK_COUNTS_SQL = """
+    SELECT dp.id, dp.name, SUM(r.bark_count) as bark_count
+    FROM daily_dog_rollup r
+    JOIN dog_profiles dp ON r.dog_id = dp.id
+    WHERE r.day >= ? AND r.day < ?
+      AND dp.confirmed = 1
+    GROUP BY dp.id
+    HAVING SUM(r.bark_count) > 0
+    ORDER BY bark_count DESC
+"""
+
+
 def _get_per_dog_bark_counts(
     store: FingerprintStore,
     start: datetime,
     end: datetime,
 ) -> list[DogBreakdownItem]:
-    """Query per-dog bark counts for confirmed dogs in a date range."""
+    """Query per-dog bark counts for confirmed dogs in a range of whole UTC days.
+
+    Reads the daily_dog_rollup table the fingerprint store keeps current, so
+    the cost scales with days x dogs rather than with stored fingerprints.
+    Confirmed dogs are visited in id order and each probes the covering
+    (dog_id, day) rollup index, so grouping by dp.id alone (name depends on
+    it) needs no temp B-tree; only the few result rows are sorted.
+
+    Args:
+        store: Fingerprint store to query.
+        start: Start of range (UTC midnight, inclusive).
+        end: End of range (UTC midnight, exclusive).
+    """
     with store._get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
-            """
-            SELECT dp.id, dp.name, COUNT(bf.id) as bark_count
-            FROM bark_fingerprints bf
-            JOIN dog_profiles dp ON bf.dog_id = dp.id
-            WHERE bf.timestamp >= ? AND bf.timestamp < ?
-              AND dp.confirmed = 1
-            GROUP BY dp.id, dp.name
-            ORDER BY bark_count DESC
-            """,
-            (start.isoformat(), end.isoformat()),
+            _PER_DOG_BARK_COUNTS_SQL,
+            (start.date().isoformat(), end.date().isoformat()),
         )
         return [
             DogBreakdownItem(
@@ -92,48 +123,70 @@ def _get_per_dog_bark_counts(
 
 
 def _calculate_period_stats(
-    entries: list[EvidenceMetadata],
+    days: list[DailyAggregate],
+    daily: dict[date, int] | None = None,
 ) -> tuple[int, int, float, float, int | None, dict[int, int]]:
-    """Calculate statistics for a list of entries.
+    """Calculate statistics for a period from its per-day aggregates.
+
+    Args:
+        days: Per-day aggregates covering the period.
+        daily: If given, local-date bark counts are merged into it in the
+            same pass.
 
     Returns:
         Tuple of (total_barks, total_events, total_duration, avg_confidence,
                   peak_hour, hourly_breakdown)
     """
-    if not entries:
+    total_barks = total_events = 0
+    total_duration = confidence_sum = 0.0
+    hourly = [0] * 24  # local time
+    for agg in days:
+        total_barks += agg.total_barks
+        total_events += agg.total_events
+        total_duration += agg.total_duration
+        confidence_sum += agg.confidence_sum
+        for hour, count in enumerate(agg.hourly):
+            hourly[hour] += count
+        if daily is not None:
+            for day, count in agg.local_daily.items():
+                daily[day] = daily.get(day, 0) + count
+
+    if not total_events:
         return 0, 0, 0.0, 0.0, None, {}
 
-    total_barks = sum(e.detection.bark_count_in_clip for e in entries)
-    total_events = len(entries)
-    total_duration = sum(e.duration_seconds for e in entries)
-    avg_confidence = sum(e.detection.peak_probability for e in entries) / total_events
-
-    # Calculate hourly breakdown (in local time)
-    hourly: dict[int, int] = defaultdict(int)
-    for entry in entries:
-        local_time = entry.timestamp_utc.astimezone(LOCAL_TZ)
-        hourly[local_time.hour] += entry.detection.bark_count_in_clip
-
-    peak_hour = max(hourly, key=hourly.get) if hourly else None
-    return total_barks, total_events, total_duration, avg_confidence, peak_hour, dict(hourly)
-
+    avg_confidence = confidence_sum / total_events
+
+    # Earliest hour with the most barks; None if no barks were counted
+    peak_hour = None
+    peak_count = 0
+    for hour, count in enumerate(hourly):
+        if count > peak_count:
+            peak_hour, peak_count = hour, count
+    return (
+        total_barks,
+        total_events,
+        total_duration,
+        avg_confidence,
+        peak_hour,
+        {hour: count for hour, count in enumerate(hourly) if count},
+    )
 
-def _calculate_daily_breakdown(entries: list[EvidenceMetadata]) -> dict[str, int]:
-    """Calculate daily bark counts from entries."""
-    daily: dict[str, int] = defaultdict(int)
-    for entry in entries:
-        local_time = entry.timestamp_utc.astimezone(LOCAL_TZ)
-        daily[local_time.strftime("%Y-%m-%d")] += entry.detection.bark_count_in_clip
-    return dict(daily)
 
+def _calculate_all_stats(
+    days: list[DailyAggregate],
+) -> tuple[int, int, float, float, int | None, dict[int, int], dict[str, int]]:
+    """Calculate period statistics and the daily breakdown in one pass.
 
-def _filter_by_date_range(
-    entries: list[EvidenceMetadata],
-    start: datetime,
-    end: datetime,
-) -> list[EvidenceMetadata]:
-    """Filter entries to those within the date range."""
-    return [e for e in entries if start <= e.timestamp_utc < end]
+    Returns:
+        Tuple of (total_barks, total_events, total_duration, avg_confidence,
+                  peak_hour, hourly_breakdown, daily_breakdown). The daily
+        breakdown is keyed in chronological order.
+    """
+    daily: dict[date, int] = {}
+    stats = _calculate_period_stats(days, daily)
+    # Format each date once, after bucketing. A UTC day's aggregate can span
+    # two local dates, so order the handful of dates here.
+    return (*stats, {day.isoformat(): daily[day] for day in sorted(daily)})
 
 
 def _parse_date(date_str: str | None, default: datetime) -> datetime:
@@ -141,7 +194,7 @@ def _parse_date(date_str: str | None, default: datetime) -> datetime:
     if date_str is None:
         return default
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        return parse_ymd(date_str)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -156,7 +209,7 @@ def _parse_date_range(start_date: str, end_date: str) -> tuple[datetime, datetim
         Tuple of (range_start, range_end_exclusive)
     """
     try:
-        range_start = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        range_start = parse_ymd(start_date)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -164,7 +217,7 @@ def _parse_date_range(start_date: str, end_date: str) -> tuple[datetime, datetim
         )
 
     try:
-        range_end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        range_end = parse_ymd(end_date)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -181,12 +234,21 @@ def _parse_date_range(start_date: str, end_date: str) -> tuple[datetime, datetim
 
 
 def _get_week_boundaries(date: datetime) -> tuple[datetime, datetime]:
-    """Get Monday-Sunday boundaries for the week containing the date."""
-    monday = date - timedelta(days=date.weekday())
-    monday = monday.replace(hour=0, minute=0, second=0, microsecond=0)
+    """Get Monday-Sunday boundaries for the week containing the (UTC) date."""
+    return _week_boundaries_from_ordinal(date.toordinal())
+
+
+@lru_cache(maxsize=512)
+def _week_boundaries_from_ordinal(ordinal: int) -> tuple[datetime, datetime]:
+    """Get Monday-Sunday UTC boundaries for the week containing a day ordinal."""
+    day = date.fromordinal(ordinal)
+    monday = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) - timedelta(
+        days=day.weekday()
+    )
     return monday, monday + timedelta(days=7)
 
 
+@lru_cache(maxsize=512)
 def _get_month_boundaries(year: int, month: int) -> tuple[datetime, datetime]:
     """Get first and last+1 day boundaries for a month."""
     start = datetime(year, month, 1, tzinfo=timezone.utc)
@@ -197,6 +259,26 @@ def _get_month_boundaries(year: int, month: int) -> tuple[datetime, datetime]:
     return start, end
 
 
+def _summary_etag(kind: str, period_start: datetime, evidence: EvidenceStorage) -> str:
+    """Build an ETag for a summary of one period.
+
+    A summary depends only on the period, the local UTC offset used for its
+    hour and day breakdowns, and the evidence index, so the index's last
+    change time stands in for hashing the response body. The app version and
+    SUMMARY_ETAG_VERSION invalidate old tags when the response format changes.
+    """
+    key = ":".join((
+        SUMMARY_ETAG_VERSION,
+        __version__,
+        kind,
+        period_start.isoformat(),
+        str(datetime.now(LOCAL_TZ).utcoffset()),
+        evidence.last_updated.isoformat(),
+        str(evidence.total_recordings),
+    ))
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
 # --- Summary Endpoints ---
 
 
@@ -207,26 +289,66 @@ async def daily_summary(
         default=None,
         description="Date in YYYY-MM-DD format. Defaults to today.",
     ),
-) -> DailySummarySchema:
-    """Get daily bark summary with hourly breakdown."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get daily bark summary with hourly breakdown.
+
+    Supports conditional requests: a matching If-None-Match returns 304.
+    """
     today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
     target_date = _parse_date(date, today)
 
     day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    entries = _filter_by_date_range(evidence._index.entries, day_start, day_start + timedelta(days=1))
+    etag = _summary_etag("daily", day_start, evidence)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    days = evidence.get_daily_aggregates(day_start, day_start + timedelta(days=1))
 
     total_barks, total_events, total_duration, avg_confidence, peak_hour, hourly = (
-        _calculate_period_stats(entries)
+        _calculate_period_stats(days)
+    )
+
+    return json_response(
+        DailySummarySchema(
+            date=target_date.strftime("%Y-%m-%d"),
+            total_barks=total_barks,
+            total_events=total_events,
+            total_duration_seconds=total_duration,
+            avg_confidence=round(avg_confidence, 4),
+            peak_hour=peak_hour,
+            hourly_breakdown=hourly,
+        ),
+        headers={"ETag": etag},
     )
 
-    return DailySummarySchema(
-        date=target_date.strftime("%Y-%m-%d"),
+
+def _build_weekly_summary(
+    evidence: EvidenceStorage,
+    week_start: datetime,
+    week_end: datetime,
+) -> WeeklySummarySchema:
+    """Build the weekly summary shared by the weekly and weekly AI endpoints.
+
+    Args:
+        evidence: Evidence storage to aggregate.
+        week_start: Monday 00:00 UTC (inclusive).
+        week_end: Following Monday 00:00 UTC (exclusive).
+    """
+    days = evidence.get_daily_aggregates(week_start, week_end)
+    total_barks, total_events, total_duration, avg_confidence, peak_hour, _, daily_breakdown = (
+        _calculate_all_stats(days)
+    )
+
+    return WeeklySummarySchema(
+        week_start=week_start,
+        week_end=week_end - timedelta(seconds=1),
         total_barks=total_barks,
         total_events=total_events,
         total_duration_seconds=total_duration,
         avg_confidence=round(avg_confidence, 4),
         peak_hour=peak_hour,
-        hourly_breakdown=hourly,
+        daily_breakdown=daily_breakdown,
     )
 
 
@@ -237,25 +359,21 @@ async def weekly_summary(
         default=None,
         description="Any date within the week (YYYY-MM-DD). Defaults to current week.",
     ),
-) -> WeeklySummarySchema:
-    """Get weekly bark summary with daily breakdown."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get weekly bark summary with daily breakdown.
+
+    Supports conditional requests: a matching If-None-Match returns 304.
+    """
     target_date = _parse_date(date, datetime.now(timezone.utc))
     week_start, week_end = _get_week_boundaries(target_date)
 
-    entries = _filter_by_date_range(evidence._index.entries, week_start, week_end)
-    total_barks, total_events, total_duration, avg_confidence, peak_hour, _ = (
-        _calculate_period_stats(entries)
-    )
+    etag = _summary_etag("weekly", week_start, evidence)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-    return WeeklySummarySchema(
-        week_start=week_start,
-        week_end=week_end - timedelta(seconds=1),
-        total_barks=total_barks,
-        total_events=total_events,
-        total_duration_seconds=total_duration,
-        avg_confidence=round(avg_confidence, 4),
-        peak_hour=peak_hour,
-        daily_breakdown=_calculate_daily_breakdown(entries),
+    return json_response(
+        _build_weekly_summary(evidence, week_start, week_end), headers={"ETag": etag}
     )
 
 
@@ -266,8 +384,12 @@ async def monthly_summary(
         default=None,
         description="Month in YYYY-MM format. Defaults to current month.",
     ),
-) -> MonthlySummarySchema:
-    """Get monthly bark summary with daily breakdown."""
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Get monthly bark summary with daily breakdown.
+
+    Supports conditional requests: a matching If-None-Match returns 304.
+    """
     today = datetime.now(timezone.utc)
 
     if month is None:
@@ -275,8 +397,7 @@ async def monthly_summary(
         month_str = today.strftime("%Y-%m")
     else:
         try:
-            parsed = datetime.strptime(month, "%Y-%m")
-            year, mon = parsed.year, parsed.month
+            year, mon = parse_year_month(month)
             month_str = month
         except ValueError:
             raise HTTPException(
@@ -285,20 +406,27 @@ async def monthly_summary(
             )
 
     month_start, month_end = _get_month_boundaries(year, mon)
-    entries = _filter_by_date_range(evidence._index.entries, month_start, month_end)
+    etag = _summary_etag("monthly", month_start, evidence)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    days = evidence.get_daily_aggregates(month_start, month_end)
 
-    total_barks, total_events, total_duration, avg_confidence, peak_hour, _ = (
-        _calculate_period_stats(entries)
+    total_barks, total_events, total_duration, avg_confidence, peak_hour, _, daily_breakdown = (
+        _calculate_all_stats(days)
     )
 
-    return MonthlySummarySchema(
-        month=month_str,
-        total_barks=total_barks,
-        total_events=total_events,
-        total_duration_seconds=total_duration,
-        avg_confidence=round(avg_confidence, 4),
-        peak_hour=peak_hour,
-        daily_breakdown=_calculate_daily_breakdown(entries),
+    return json_response(
+        MonthlySummarySchema(
+            month=month_str,
+            total_barks=total_barks,
+            total_events=total_events,
+            total_duration_seconds=total_duration,
+            avg_confidence=round(avg_confidence, 4),
+            peak_hour=peak_hour,
+            daily_breakdown=daily_breakdown,
+        ),
+        headers={"ETag": etag},
     )
 
 
@@ -311,14 +439,25 @@ async def range_summary(
 ) -> RangeSummarySchema:
     """Get bark summary for a custom date range."""
     range_start, range_end_exclusive = _parse_date_range(start_date, end_date)
-    entries = _filter_by_date_range(evidence._index.entries, range_start, range_end_exclusive)
 
-    total_barks, total_events, total_duration, avg_confidence, peak_hour, hourly = (
-        _calculate_period_stats(entries)
+    # Run the SQLite query in the executor while the stats are computed here
+    fingerprint_store = get_fingerprint_store(request)
+    loop = asyncio.get_event_loop()
+    dog_breakdown_future = loop.run_in_executor(
+        None, _get_per_dog_bark_counts, fingerprint_store, range_start, range_end_exclusive
     )
 
-    fingerprint_store = get_fingerprint_store(request)
-    dog_breakdown = _get_per_dog_bark_counts(fingerprint_store, range_start, range_end_exclusive)
+    days = evidence.get_daily_aggregates(range_start, range_end_exclusive)
+    (
+        total_barks,
+        total_events,
+        total_duration,
+        avg_confidence,
+        peak_hour,
+        hourly,
+        daily_breakdown,
+    ) = _calculate_all_stats(days)
+    dog_breakdown = await dog_breakdown_future
 
     return RangeSummarySchema(
         start_date=start_date,
@@ -328,7 +467,7 @@ async def range_summary(
         total_duration_seconds=total_duration,
         avg_confidence=round(avg_confidence, 4),
         peak_hour=peak_hour,
-        daily_breakdown=_calculate_daily_breakdown(entries),
+        daily_breakdown=daily_breakdown,
         hourly_breakdown=hourly,
         dog_breakdown=dog_breakdown,
     )
@@ -346,6 +485,20 @@ def _get_weekly_summary_prompty() -> prompty.Prompty:
     return _weekly_summary_prompty
 
 
+def _get_weekly_summary_template() -> jinja2.Template:
+    """Lazily compile the weekly summary prompt body.
+
+    prompty's Jinja2Renderer builds a new Environment and recompiles the
+    template on every invoke, so the body is compiled once here with the
+    same default Environment settings.
+    """
+    global _weekly_summary_template
+    if _weekly_summary_template is None:
+        env = jinja2.Environment(auto_reload=False)
+        _weekly_summary_template = env.from_string(_get_weekly_summary_prompty().content)
+    return _weekly_summary_template
+
+
 def _format_duration(total_seconds: float) -> str:
     """Format duration in seconds to human-readable string."""
     hours = int(total_seconds // 3600)
@@ -355,6 +508,15 @@ def _format_duration(total_seconds: float) -> str:
     return f"{minutes}m"
 
 
+@lru_cache(maxsize=512)
+def _format_day_name(day: str) -> str:
+    """Format a YYYY-MM-DD key as e.g. "Monday, January 05"."""
+    try:
+        return date.fromisoformat(day).strftime("%A, %B %d")
+    except ValueError:
+        return day
+
+
 def _format_llm_prompt(
     start_display: str,
     end_display: str,
@@ -369,14 +531,10 @@ def _format_llm_prompt(
     """Format bark data as a prompt for the LLM."""
     peak_hour_str = f"{peak_hour}:00-{peak_hour + 1}:00" if peak_hour is not None else "N/A"
 
-    # Format daily breakdown
+    # Format daily breakdown (already chronological, see _calculate_all_stats)
     daily_lines = []
-    for day, count in sorted(daily_breakdown.items()):
-        try:
-            day_name = datetime.strptime(day, "%Y-%m-%d").strftime("%A, %B %d")
-        except ValueError:
-            day_name = day
-        daily_lines.append(f"- {day_name}: {count} barks")
+    for day, count in daily_breakdown.items():
+        daily_lines.append(f"- {_format_day_name(day)}: {count} barks")
     daily_text = "\n".join(daily_lines) if daily_lines else "No data recorded"
 
     # Format per-dog breakdown
@@ -389,10 +547,7 @@ def _format_llm_prompt(
         per_dog_text = "No individual dogs identified yet."
 
     # Render template
-    prompty_obj = _get_weekly_summary_prompty()
-    renderer = Jinja2Renderer(prompty=prompty_obj)
-
-    return renderer.invoke({
+    return _get_weekly_summary_template().render({
         "week_start": start_display,
         "week_end": end_display,
         "total_barks": total_barks,
@@ -405,17 +560,29 @@ def _format_llm_prompt(
     })
 
 
-async def _call_ollama(prompt: str) -> tuple[str, int]:
+def create_ollama_client() -> httpx.AsyncClient:
+    """Create the long-lived Ollama client, kept on app state for the app's lifetime.
+
+    Reusing one client keeps connections to Ollama alive between AI summary
+    requests instead of reconnecting for each one.
+    """
+    return httpx.AsyncClient(
+        base_url=OLLAMA_URL,
+        timeout=60.0,
+        limits=httpx.Limits(max_keepalive_connections=4),
+    )
+
+
+async def _call_ollama(client: httpx.AsyncClient, prompt: str) -> tuple[str, int]:
     """Call Ollama and return (response_text, generation_time_ms)."""
     start_time = time.time()
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": False},
-            )
-            response.raise_for_status()
-            result = response.json()
+        response = await client.post(
+            "/api/generate",
+            json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": False},
+        )
+        response.raise_for_status()
+        result = response.json()
     except httpx.ConnectError:
         raise HTTPException(
             status_code=503,
@@ -431,6 +598,166 @@ async def _call_ollama(prompt: str) -> tuple[str, int]:
     return result.get("response", "").strip(), generation_time_ms
 
 
+async def _open_ollama_stream(client: httpx.AsyncClient, prompt: str) -> httpx.Response:
+    """Start a streaming Ollama generation and return the open response.
+
+    Connection and HTTP errors surface here, before any body is sent, so
+    they can still become 503/502 responses. The caller must close it.
+    """
+    request = client.build_request(
+        "POST",
+        "/api/generate",
+        json={"model": OLLAMA_MODEL, "prompt": prompt, "stream": True},
+    )
+    try:
+        response = await client.send(request, stream=True)
+    except httpx.ConnectError:
+        raise HTTPException(
+            status_code=503,
+            detail="Ollama service not available. Is it running?",
+        )
+    if response.is_error:
+        await response.aread()
+        await response.aclose()
+        raise HTTPException(
+            status_code=502,
+            detail=f"Ollama error: {response.text}",
+        )
+    return response
+
+
+def _sse_event(data: dict) -> str:
+    """Format one Server-Sent Events message with a JSON payload."""
+    return f"data: {json.dumps(data)}\n\n"
+
+
+async def _stream_summary_events(
+    store: FingerprintStore,
+    cache_key: str,
+    response: httpx.Response | None,
+    cached: str | None,
+    data_period: str,
+) -> AsyncIterator[str]:
+    """Yield summary text as SSE token events, then a final metadata event.
+
+    A cached summary is sent as a single token. A live generation is
+    relayed token by token and cached once complete.
+    """
+    if response is None:
+        summary_text, generation_time_ms = cached or "", 0
+        yield _sse_event({"token": summary_text})
+    else:
+        start_time = time.time()
+        pieces: list[str] = []
+        try:
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                token = chunk.get("response", "")
+                if token:
+                    pieces.append(token)
+                    yield _sse_event({"token": token})
+                if chunk.get("done"):
+                    break
+        finally:
+            await response.aclose()
+
+        generation_time_ms = int((time.time() - start_time) * 1000)
+        summary_text = "".join(pieces).strip()
+        if summary_text:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None,
+                store.cache_summary,
+                cache_key,
+                OLLAMA_MODEL,
+                summary_text,
+                generation_time_ms,
+            )
+
+    yield _sse_event({
+        "done": True,
+        "model": OLLAMA_MODEL,
+        "generation_time_ms": generation_time_ms,
+        "data_period": data_period,
+    })
+
+
+def _summary_cache_key(prompt: str, model: str) -> str:
+    """Content-address a summary by the prompt and model that produce it."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model.encode())
+    digest.update(b"\0")
+    digest.update(prompt.encode())
+    return digest.hexdigest()
+
+
+async def _generate_summary(
+    store: FingerprintStore,
+    client: httpx.AsyncClient,
+    prompt: str,
+    refresh: bool = False,
+) -> tuple[str, int]:
+    """Return (summary_text, generation_time_ms), reusing cached summaries.
+
+    Identical prompts only arise from identical period data, so a cached
+    summary is served as-is with a generation time of 0. With refresh, the
+    summary is regenerated and replaces the cached one.
+    """
+    key = _summary_cache_key(prompt, OLLAMA_MODEL)
+    loop = asyncio.get_event_loop()
+    if not refresh:
+        cached = await loop.run_in_executor(None, store.get_cached_summary, key)
+        if cached is not None:
+            return cached, 0
+
+    summary_text, generation_time_ms = await _call_ollama(client, prompt)
+    if summary_text:
+        await loop.run_in_executor(
+            None, store.cache_summary, key, OLLAMA_MODEL, summary_text, generation_time_ms
+        )
+    return summary_text, generation_time_ms
+
+
+async def _build_weekly_prompt(
+    request: Request,
+    evidence: EvidenceStorage,
+    date: str | None,
+) -> tuple[str, str]:
+    """Build the weekly summary prompt.
+
+    Returns:
+        Tuple of (prompt, data_period)
+    """
+    target_date = _parse_date(date, datetime.now(timezone.utc))
+    week_start, week_end = _get_week_boundaries(target_date)
+
+    # Run the SQLite query in the executor while the stats are computed here
+    fingerprint_store = get_fingerprint_store(request)
+    loop = asyncio.get_event_loop()
+    per_dog_future = loop.run_in_executor(
+        None, _get_per_dog_bark_counts, fingerprint_store, week_start, week_end
+    )
+
+    summary = _build_weekly_summary(evidence, week_start, week_end)
+    per_dog_counts = await per_dog_future
+
+    prompt = _format_llm_prompt(
+        start_display=week_start.strftime("%B %d"),
+        end_display=summary.week_end.strftime("%B %d, %Y"),
+        total_barks=summary.total_barks,
+        total_events=summary.total_events,
+        total_duration_seconds=summary.total_duration_seconds,
+        avg_confidence=summary.avg_confidence,
+        peak_hour=summary.peak_hour,
+        daily_breakdown=summary.daily_breakdown,
+        per_dog_counts=per_dog_counts,
+    )
+
+    return prompt, f"{week_start.strftime('%Y-%m-%d')} to {summary.week_end.strftime('%Y-%m-%d')}"
+
+
 # --- AI Summary Endpoints ---
 
 
@@ -438,42 +765,64 @@ async def _call_ollama(prompt: str) -> tuple[str, int]:
 async def weekly_ai_summary(
     request: Request,
     evidence: EvidenceStorage = Depends(get_evidence),
+    ollama_client: httpx.AsyncClient = Depends(get_ollama_client),
     date: str | None = Query(
         default=None,
         description="Any date within the week (YYYY-MM-DD). Defaults to current week.",
     ),
+    refresh: bool = Query(
+        default=False,
+        description="Regenerate the summary instead of reusing a cached one.",
+    ),
 ) -> AISummarySchema:
     """Get AI-generated summary of weekly bark data."""
-    target_date = _parse_date(date, datetime.now(timezone.utc))
-    week_start, week_end = _get_week_boundaries(target_date)
-
-    entries = _filter_by_date_range(evidence._index.entries, week_start, week_end)
-    total_barks, total_events, total_duration, avg_confidence, peak_hour, _ = (
-        _calculate_period_stats(entries)
-    )
-
+    prompt, data_period = await _build_weekly_prompt(request, evidence, date)
     fingerprint_store = get_fingerprint_store(request)
-    per_dog_counts = _get_per_dog_bark_counts(fingerprint_store, week_start, week_end)
 
-    prompt = _format_llm_prompt(
-        start_display=week_start.strftime("%B %d"),
-        end_display=(week_end - timedelta(seconds=1)).strftime("%B %d, %Y"),
-        total_barks=total_barks,
-        total_events=total_events,
-        total_duration_seconds=total_duration,
-        avg_confidence=avg_confidence,
-        peak_hour=peak_hour,
-        daily_breakdown=_calculate_daily_breakdown(entries),
-        per_dog_counts=per_dog_counts,
+    summary_text, generation_time_ms = await _generate_summary(
+        fingerprint_store, ollama_client, prompt, refresh
     )
 
-    summary_text, generation_time_ms = await _call_ollama(prompt)
-
     return AISummarySchema(
         summary=summary_text,
         model=OLLAMA_MODEL,
         generation_time_ms=generation_time_ms,
-        data_period=f"{week_start.strftime('%Y-%m-%d')} to {(week_end - timedelta(seconds=1)).strftime('%Y-%m-%d')}",
+        data_period=data_period,
+    )
+
+
+@router.get("/weekly/ai/stream")
+async def weekly_ai_summary_stream(
+    request: Request,
+    evidence: EvidenceStorage = Depends(get_evidence),
+    ollama_client: httpx.AsyncClient = Depends(get_ollama_client),
+    date: str | None = Query(
+        default=None,
+        description="Any date within the week (YYYY-MM-DD). Defaults to current week.",
+    ),
+    refresh: bool = Query(
+        default=False,
+        description="Regenerate the summary instead of reusing a cached one.",
+    ),
+) -> StreamingResponse:
+    """Stream an AI-generated weekly summary as Server-Sent Events.
+
+    Each event carries JSON: {"token": ...} for each piece of generated
+    text, then {"done": true, ...} with the same metadata as /weekly/ai.
+    """
+    prompt, data_period = await _build_weekly_prompt(request, evidence, date)
+    fingerprint_store = get_fingerprint_store(request)
+
+    cache_key = _summary_cache_key(prompt, OLLAMA_MODEL)
+    cached = None
+    if not refresh:
+        loop = asyncio.get_event_loop()
+        cached = await loop.run_in_executor(None, fingerprint_store.get_cached_summary, cache_key)
+    response = None if cached is not None else await _open_ollama_stream(ollama_client, prompt)
+
+    return StreamingResponse(
+        _stream_summary_events(fingerprint_store, cache_key, response, cached, data_period),
+        media_type="text/event-stream",
     )
 
 
@@ -481,26 +830,33 @@ async def weekly_ai_summary(
 async def range_ai_summary(
     request: Request,
     evidence: EvidenceStorage = Depends(get_evidence),
+    ollama_client: httpx.AsyncClient = Depends(get_ollama_client),
     start_date: str = Query(description="Start date in YYYY-MM-DD format."),
     end_date: str = Query(description="End date in YYYY-MM-DD format (inclusive)."),
+    refresh: bool = Query(
+        default=False,
+        description="Regenerate the summary instead of reusing a cached one.",
+    ),
 ) -> AISummarySchema:
     """Get AI-generated summary for a custom date range."""
     range_start, range_end_exclusive = _parse_date_range(start_date, end_date)
 
-    entries = _filter_by_date_range(evidence._index.entries, range_start, range_end_exclusive)
-    total_barks, total_events, total_duration, avg_confidence, peak_hour, _ = (
-        _calculate_period_stats(entries)
+    # Run the SQLite query in the executor while the stats are computed here
+    fingerprint_store = get_fingerprint_store(request)
+    loop = asyncio.get_event_loop()
+    per_dog_future = loop.run_in_executor(
+        None, _get_per_dog_bark_counts, fingerprint_store, range_start, range_end_exclusive
     )
 
-    fingerprint_store = get_fingerprint_store(request)
-    per_dog_counts = _get_per_dog_bark_counts(fingerprint_store, range_start, range_end_exclusive)
+    days = evidence.get_daily_aggregates(range_start, range_end_exclusive)
+    total_barks, total_events, total_duration, avg_confidence, peak_hour, _, daily_breakdown = (
+        _calculate_all_stats(days)
+    )
+    per_dog_counts = await per_dog_future
 
-    # Parse dates for display
-    try:
-        start_display = datetime.strptime(start_date, "%Y-%m-%d").strftime("%B %d")
-        end_display = datetime.strptime(end_date, "%Y-%m-%d").strftime("%B %d, %Y")
-    except ValueError:
-        start_display, end_display = start_date, end_date
+    # Dates for display (already validated by _parse_date_range)
+    start_display = range_start.strftime("%B %d")
+    end_display = (range_end_exclusive - timedelta(days=1)).strftime("%B %d, %Y")
 
     prompt = _format_llm_prompt(
         start_display=start_display,
@@ -510,11 +866,13 @@ async def range_ai_summary(
         total_duration_seconds=total_duration,
         avg_confidence=avg_confidence,
         peak_hour=peak_hour,
-        daily_breakdown=_calculate_daily_breakdown(entries),
+        daily_breakdown=daily_breakdown,
         per_dog_counts=per_dog_counts,
     )
 
-    summary_text, generation_time_ms = await _call_ollama(prompt)
+    summary_text, generation_time_ms = await _generate_summary(
+        fingerprint_store, ollama_client, prompt, refresh
+    )
 
     return AISummarySchema(
         summary=summary_text,
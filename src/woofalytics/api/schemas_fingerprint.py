@@ -234,6 +234,7 @@ class ClusterSuggestionSchema(BaseModel):
 class ClusterResultSchema(BaseModel):
     """Result of clustering untagged barks."""
 
+    run_id: str = Field(description="Identifier of this clustering run, used to create dogs from it")
     cluster_count: int = Field(description="Number of clusters identified")
     total_untagged: int = Field(description="Total untagged fingerprints processed")
     noise_count: int = Field(description="Fingerprints that didn't fit any cluster")
@@ -245,6 +246,7 @@ class ClusterResultSchema(BaseModel):
 class CreateDogFromClusterRequestSchema(BaseModel):
     """Request to create a dog profile from a cluster."""
 
+    run_id: str = Field(description="Clustering run the cluster was returned by")
     name: str = Field(default="", description="Name for the new dog profile")
     notes: str = Field(default="", description="Optional notes about the dog")
 
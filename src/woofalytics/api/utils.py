@@ -0,0 +1,60 @@
+"""Helpers shared by the API routers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(content: BaseModel, headers: dict[str, str] | None = None) -> Response:
+    """Serialize an already-validated schema straight to a JSON response.
+
+    Returning a Response skips FastAPI's response_model re-validation and
+    jsonable_encoder pass. The route's response_model is still used for docs.
+    """
+    return Response(
+        content=content.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def parse_ymd(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD string to UTC midnight by slicing.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date.
+    """
+    year, month, day = date_str[:4], date_str[5:7], date_str[8:]
+    if (
+        len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+        or not (year + month + day).isdigit()
+    ):
+        raise ValueError(f"Invalid date: {date_str}")
+    return datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+
+
+def parse_year_month(month_str: str) -> tuple[int, int]:
+    """Parse a YYYY-MM string by slicing.
+
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM month.
+    """
+    year, month = month_str[:4], month_str[5:]
+    if len(month_str) != 7 or month_str[4] != "-" or not (year + month).isdigit():
+        raise ValueError(f"Invalid month: {month_str}")
+    if not 1 <= int(month) <= 12:
+        raise ValueError(f"Invalid month: {month_str}")
+    return int(year), int(month)
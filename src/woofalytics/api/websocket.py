@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
 from typing import Any
 
+import numpy as np
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketClose
 import structlog
@@ -45,6 +47,26 @@ class WebSocketManagers:
         )
 
 
+# Sent on ticks where the pipeline state did not change
+_HEARTBEAT: dict[str, Any] = {"type": "heartbeat"}
+
+# /ws/bark sends an application-level ping after this long without client
+# messages. A failed send drops the socket, so half-open connections are pruned
+# whatever the ASGI server's protocol-level ping settings are.
+BARK_IDLE_PING_SECONDS = 30.0
+_BARK_IDLE_PING: dict[str, Any] = {"type": "ping"}
+
+
+# A broadcast waits at most this long for any one client before dropping it,
+# so a stalled socket cannot hold up the bark event broadcaster
+BROADCAST_SEND_TIMEOUT_SECONDS = 2.0
+
+
+def _encode_message(message: dict[str, Any]) -> str:
+    """Serialize a message exactly as WebSocket.send_json would."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 class ConnectionManager:
     """Manages WebSocket connections for broadcasting.
 
@@ -56,48 +78,56 @@ class ConnectionManager:
 
     def __init__(self, name: str = "default") -> None:
         self.name = name
-        self.active_connections: list[WebSocket] = []
-        self._lock = asyncio.Lock()
+        # Copy-on-write: every change rebinds a new frozenset, so readers can
+        # hold the current one as a snapshot. Updates run on the event loop
+        # without awaiting in between, which makes them atomic without a lock.
+        # WebSockets hash by identity.
+        self.active_connections: frozenset[WebSocket] = frozenset()
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        async with self._lock:
-            self.active_connections.append(websocket)
+        self.active_connections = self.active_connections | {websocket}
         logger.info("websocket_connected", manager=self.name, count=len(self.active_connections))
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
-        removed = False
-        async with self._lock:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
-                removed = True
-        if removed:
+        if websocket in self.active_connections:
+            self.active_connections = self.active_connections - {websocket}
             logger.info("websocket_disconnected", manager=self.name, count=len(self.active_connections))
 
     async def broadcast(self, message: dict[str, Any]) -> None:
         """Broadcast a message to all connected clients.
 
-        Handles disconnected clients gracefully by removing them.
+        The message is serialized once and the same text frame is sent to
+        every client concurrently. Each send is bounded by
+        BROADCAST_SEND_TIMEOUT_SECONDS; clients that time out or fail are
+        removed, so a stalled client delays a broadcast by at most that long.
         """
-        async with self._lock:
-            connections = self.active_connections.copy()
-
-        disconnected = []
-
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        connections = self.active_connections
+        if not connections:
+            return
+        payload = _encode_message(message)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    connection.send_text(payload),
+                    timeout=BROADCAST_SEND_TIMEOUT_SECONDS,
+                )
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
+        disconnected = [
+            connection
+            for connection, result in zip(connections, results)
+            if isinstance(result, Exception)
+        ]
 
         # Clean up disconnected clients
         if disconnected:
-            async with self._lock:
-                for conn in disconnected:
-                    if conn in self.active_connections:
-                        self.active_connections.remove(conn)
+            self.active_connections = self.active_connections.difference(disconnected)
 
     async def send_personal(
         self,
@@ -207,25 +237,25 @@ async def websocket_bark_endpoint(websocket: WebSocket) -> None:
 
     try:
         while True:
-            # Keep connection alive and handle any incoming messages
             try:
                 data = await asyncio.wait_for(
                     websocket.receive_text(),
-                    timeout=30.0,
+                    timeout=BARK_IDLE_PING_SECONDS,
                 )
-                # Handle client messages (ping, commands, etc.)
-                try:
-                    message = json.loads(data)
-                    if message.get("type") == "ping":
-                        if not await manager.send_personal(websocket, {"type": "pong"}):
-                            break
-                except json.JSONDecodeError:
-                    pass
-
             except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                if not await manager.send_personal(websocket, {"type": "ping"}):
+                # Idle: ping so a dead peer is detected and dropped
+                if not await manager.send_personal(websocket, _BARK_IDLE_PING):
                     break
+                continue
+
+            # Handle client messages (ping, commands, etc.)
+            try:
+                message = json.loads(data)
+                if message.get("type") == "ping":
+                    if not await manager.send_personal(websocket, {"type": "pong"}):
+                        break
+            except json.JSONDecodeError:
+                pass
 
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
@@ -252,6 +282,10 @@ async def websocket_pipeline_endpoint(websocket: WebSocket) -> None:
             "stats": {"vad_skipped": 100, "yamnet_skipped": 50, "clap_inferences": 200, "total_barks": 5}
         }
     }
+
+    The full state is sent once on connect. After that, each tick sends only
+    the top-level keys that changed, {"type": "pipeline_delta", "data": {...}},
+    or {"type": "heartbeat"} when nothing did.
     """
     # Verify authentication before accepting connection
     if not await verify_websocket_token(websocket):
@@ -266,14 +300,22 @@ async def websocket_pipeline_endpoint(websocket: WebSocket) -> None:
     detector = websocket.app.state.detector
 
     try:
+        last_state: dict[str, Any] | None = None
         while True:
-            # Get current pipeline state
+            # Get current pipeline state (a fresh top-level dict; the detector
+            # replaces nested stage dicts rather than mutating them)
             state = detector.get_pipeline_state()
 
-            success = await manager.send_personal(websocket, {
-                "type": "pipeline_state",
-                "data": state,
-            })
+            if last_state is None:
+                message = {"type": "pipeline_state", "data": state}
+            else:
+                # Stage dicts such as clap (with its top_scores) only change
+                # on inference, so most ticks carry just vad and stats
+                delta = {key: value for key, value in state.items() if last_state.get(key) != value}
+                message = {"type": "pipeline_delta", "data": delta} if delta else _HEARTBEAT
+            last_state = state
+
+            success = await manager.send_personal(websocket, message)
             if not success:
                 break
 
@@ -295,8 +337,6 @@ async def websocket_audio_endpoint(websocket: WebSocket) -> None:
     Sends audio level updates at ~10Hz for VU meter visualization.
     Format: {"type": "audio_level", "data": {"level": 0.75, "peak": 0.92}}
     """
-    import numpy as np
-
     # Verify authentication before accepting connection
     if not await verify_websocket_token(websocket):
         await websocket.close(code=4001, reason="Invalid credentials")
@@ -336,12 +376,17 @@ async def websocket_audio_endpoint(websocket: WebSocket) -> None:
                     audio_data = b"".join(f.data for f in frames)
                     audio_array = np.frombuffer(audio_data, dtype=np.int16)
 
-                    # Calculate RMS level
-                    rms = np.sqrt(np.mean(audio_array.astype(np.float32) ** 2))
-                    level = min(1.0, float(rms) / 32768.0 * 10)  # Normalize to 0-1
-
-                    # Calculate peak
-                    peak = min(1.0, float(np.abs(audio_array).max()) / 32768.0)
+                    # Calculate RMS level. One float32 copy feeds a BLAS dot
+                    # product, avoiding the squared temporary; int16 dot/vdot
+                    # would accumulate (and overflow) in int16.
+                    samples = audio_array.astype(np.float32)
+                    rms = math.sqrt(float(np.dot(samples, samples)) / samples.size)
+                    level = min(1.0, rms / 32768.0 * 10)  # Normalize to 0-1
+
+                    # Calculate peak from the extremes: no abs() temporary, and
+                    # no int16 wraparound of -32768 to itself under np.abs
+                    peak_abs = max(int(audio_array.max()), -int(audio_array.min()))
+                    peak = min(1.0, peak_abs / 32768.0)
 
             # Always send audio level update to keep connection alive
             success = await manager.send_personal(websocket, {
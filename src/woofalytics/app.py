@@ -9,6 +9,8 @@ This module provides the main web application with:
 from __future__ import annotations
 
 import asyncio
+import json
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from datetime import datetime
@@ -24,6 +26,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from woofalytics import __version__
 from woofalytics.api.auth import configure_auth, get_auth_status, setup_auth
 from woofalytics.api.ratelimit import configure_rate_limits, setup_rate_limiting
+from woofalytics.api.routes_summary import create_ollama_client
 from woofalytics.api.websocket import WebSocketManagers, broadcast_bark_event
 from woofalytics.config import configure_logging, load_settings
 from woofalytics.detection.model import BarkDetector, BarkEvent
@@ -51,6 +54,24 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def get_openapi_json(app: FastAPI) -> bytes:
+    """Get the OpenAPI document as pre-rendered JSON bytes.
+
+    The schema is rendered once and kept on app.state, so serving
+    /api/openapi.json is a plain bytes response with no per-request encoding.
+    """
+    openapi_json = getattr(app.state, "openapi_json", None)
+    if openapi_json is None:
+        openapi_json = json.dumps(
+            app.openapi(),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        app.state.openapi_json = openapi_json
+    return openapi_json
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan - startup and shutdown.
@@ -197,7 +218,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.ws_managers = ws_managers  # Separate managers for bark/pipeline/audio
     app.state.fingerprint_store = fingerprint_store
     app.state.fingerprint_matcher = fingerprint_matcher
+    app.state.cluster_runs = OrderedDict()  # Recent clustering runs for create-dog
     app.state.notification_manager = notification_manager
+    app.state.ollama_client = create_ollama_client()
 
     # Start background task for evidence saving
     async def evidence_saver() -> None:
@@ -207,6 +230,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     evidence_task = asyncio.create_task(evidence_saver())
 
+    # Render the OpenAPI document now so the first docs request doesn't pay for it
+    get_openapi_json(app)
+    logger.debug("openapi_prebuilt", paths=len(app.openapi_schema["paths"]))
+
     logger.info("woofalytics_started")
 
     yield
@@ -221,6 +248,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         pass
 
     notification_manager.stop()
+    await app.state.ollama_client.aclose()
     await detector.stop()
 
     logger.info("woofalytics_stopped")
@@ -242,6 +270,16 @@ def create_app() -> FastAPI:
         openapi_url="/api/openapi.json",
     )
 
+    # Replace FastAPI's OpenAPI route, which re-encodes the schema on every hit,
+    # with one that serves the pre-rendered document
+    app.router.routes = [
+        route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url
+    ]
+
+    @app.get(app.openapi_url, include_in_schema=False, response_model=None)
+    async def openapi_json() -> Response:
+        return Response(content=get_openapi_json(app), media_type="application/json")
+
     # CORS middleware - restrict to localhost by default for security
     # Note: CORS origins are configured at startup via lifespan, but we need
     # sensible defaults here. For custom origins, set WOOFALYTICS__SERVER__CORS_ORIGINS
@@ -5,6 +5,7 @@ for council complaints and legal documentation.
 """
 
 from woofalytics.evidence.metadata import (
+    DailyAggregate,
     DetectionInfo,
     DeviceInfo,
     EvidenceMetadata,
@@ -13,6 +14,7 @@ from woofalytics.evidence.metadata import (
 from woofalytics.evidence.storage import EvidenceStorage, PendingRecording
 
 __all__ = [
+    "DailyAggregate",
     "DetectionInfo",
     "DeviceInfo",
     "EvidenceMetadata",
@@ -6,16 +6,32 @@ designed to be useful for council complaints and legal documentation.
 
 from __future__ import annotations
 
+import bisect
 import socket
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter, methodcaller
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# System local timezone, used for hour-of-day and calendar-day breakdowns
+LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+_EPOCH_DATE = date(1970, 1, 1)
+_SECONDS_PER_DAY = 86400
+
+# C-level field accessors for bulk passes over entries
+_get_timestamp_utc = attrgetter("timestamp_utc")
+_get_bark_count = attrgetter("detection.bark_count_in_clip")
+_get_duration = attrgetter("duration_seconds")
+_get_peak_probability = attrgetter("detection.peak_probability")
+_to_epoch = methodcaller("timestamp")
+
 
 @dataclass
 class DetectionInfo:
@@ -180,6 +196,90 @@ class EvidenceMetadata:
         )
 
 
+@dataclass
+class DailyAggregate:
+    """Running bark totals for the evidence recorded on one UTC day.
+
+    Hourly and per-date counts are bucketed in local time, matching how
+    summaries are displayed; a UTC day can span two local dates.
+    """
+
+    total_barks: int = 0
+    total_events: int = 0
+    total_duration: float = 0.0
+    confidence_sum: float = 0.0
+    hourly: list[int] = field(default_factory=lambda: [0] * 24)
+    local_daily: dict[date, int] = field(default_factory=dict)
+
+    def add(self, metadata: EvidenceMetadata) -> None:
+        """Fold an evidence entry into the totals."""
+        barks = metadata.detection.bark_count_in_clip
+        local_time = metadata.timestamp_utc.astimezone(LOCAL_TZ)
+        local_day = local_time.date()
+
+        self.total_barks += barks
+        self.total_events += 1
+        self.total_duration += metadata.duration_seconds
+        self.confidence_sum += metadata.detection.peak_probability
+        self.hourly[local_time.hour] += barks
+        self.local_daily[local_day] = self.local_daily.get(local_day, 0) + barks
+
+
+def _aggregate_by_day(entries: list[EvidenceMetadata]) -> dict[date, DailyAggregate]:
+    """Bulk-build per-day aggregates with NumPy column reductions.
+
+    Equivalent to calling DailyAggregate.add for every entry, but reduces
+    whole columns at once, which matters when loading a large index.
+    """
+    n = len(entries)
+    if n == 0:
+        return {}
+
+    timestamps = map(_to_epoch, map(_get_timestamp_utc, entries))
+    epoch = np.fromiter(timestamps, dtype=np.float64, count=n).astype(np.int64)
+    barks = np.fromiter(map(_get_bark_count, entries), dtype=np.int64, count=n)
+    durations = np.fromiter(map(_get_duration, entries), dtype=np.float64, count=n)
+    confidences = np.fromiter(map(_get_peak_probability, entries), dtype=np.float64, count=n)
+
+    # LOCAL_TZ is the fixed offset captured at startup, as used by add()
+    offset = int(datetime.now(LOCAL_TZ).utcoffset().total_seconds())
+    utc_day = epoch // _SECONDS_PER_DAY
+    local = epoch + offset
+    local_hour = (local // 3600) % 24
+    # A local date is at most one day either side of its UTC date
+    local_day_shift = local // _SECONDS_PER_DAY - utc_day + 1
+
+    days, inverse = np.unique(utc_day, return_inverse=True)
+    n_days = len(days)
+    day_barks = np.bincount(inverse, weights=barks, minlength=n_days)
+    day_events = np.bincount(inverse, minlength=n_days)
+    day_durations = np.bincount(inverse, weights=durations, minlength=n_days)
+    day_confidences = np.bincount(inverse, weights=confidences, minlength=n_days)
+    hourly = np.zeros((n_days, 24), dtype=np.int64)
+    np.add.at(hourly, (inverse, local_hour), barks)
+    shifted_barks = np.zeros((n_days, 3), dtype=np.int64)
+    np.add.at(shifted_barks, (inverse, local_day_shift), barks)
+    shifted_events = np.zeros((n_days, 3), dtype=np.int64)
+    np.add.at(shifted_events, (inverse, local_day_shift), 1)
+
+    aggregates: dict[date, DailyAggregate] = {}
+    for i, day_number in enumerate(days.tolist()):
+        day = _EPOCH_DATE + timedelta(days=day_number)
+        aggregates[day] = DailyAggregate(
+            total_barks=int(day_barks[i]),
+            total_events=int(day_events[i]),
+            total_duration=float(day_durations[i]),
+            confidence_sum=float(day_confidences[i]),
+            hourly=hourly[i].tolist(),
+            local_daily={
+                day + timedelta(days=shift - 1): int(shifted_barks[i, shift])
+                for shift in range(3)
+                if shifted_events[i, shift]
+            },
+        )
+    return aggregates
+
+
 @dataclass
 class EvidenceIndex:
     """Index of all evidence files for quick lookup.
@@ -190,12 +290,52 @@ class EvidenceIndex:
 
     entries: list[EvidenceMetadata] = field(default_factory=list)
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _timestamps: list[datetime] = field(default_factory=list, init=False, repr=False)
+    _daily: dict[date, DailyAggregate] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build lookup structures for the initial entries."""
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Sort entries by time and recompute timestamps and per-day aggregates."""
+        self.entries.sort(key=_get_timestamp_utc)
+        self._timestamps = list(map(_get_timestamp_utc, self.entries))
+        self._daily = _aggregate_by_day(self.entries)
+
+    def _add_to_daily(self, metadata: EvidenceMetadata) -> None:
+        """Fold an entry into its UTC day's aggregate."""
+        day = metadata.timestamp_utc.astimezone(timezone.utc).date()
+        agg = self._daily.get(day)
+        if agg is None:
+            agg = self._daily[day] = DailyAggregate()
+        agg.add(metadata)
 
     def add(self, metadata: EvidenceMetadata) -> None:
         """Add a new entry to the index."""
-        self.entries.append(metadata)
+        # Entries arrive in time order, so this is normally an append
+        pos = bisect.bisect_right(self._timestamps, metadata.timestamp_utc)
+        self.entries.insert(pos, metadata)
+        self._timestamps.insert(pos, metadata.timestamp_utc)
+        self._add_to_daily(metadata)
+        self.last_updated = datetime.now(timezone.utc)
+
+    def replace_entries(self, entries: list[EvidenceMetadata]) -> None:
+        """Replace all entries (e.g. after cleanup) and rebuild aggregates."""
+        self.entries = entries
+        self._rebuild()
         self.last_updated = datetime.now(timezone.utc)
 
+    def get_daily_aggregates(self, start: date, end: date) -> list[DailyAggregate]:
+        """Get aggregates for UTC days in [start, end), skipping empty days."""
+        daily = self._daily
+        aggregates = []
+        for offset in range((end - start).days):
+            agg = daily.get(start + timedelta(days=offset))
+            if agg is not None:
+                aggregates.append(agg)
+        return aggregates
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -217,27 +357,24 @@ class EvidenceIndex:
         start: datetime,
         end: datetime,
     ) -> list[EvidenceMetadata]:
-        """Get entries within a date range."""
-        return [
-            e for e in self.entries
-            if start <= e.timestamp_utc <= end
-        ]
+        """Get entries within a date range (inclusive on both ends)."""
+        lo = bisect.bisect_left(self._timestamps, start)
+        hi = bisect.bisect_right(self._timestamps, end)
+        return self.entries[lo:hi]
 
     def get_recent(self, count: int = 10) -> list[EvidenceMetadata]:
         """Get most recent entries."""
-        sorted_entries = sorted(
-            self.entries,
-            key=lambda e: e.timestamp_utc,
-            reverse=True,
-        )
-        return sorted_entries[:count]
+        if count <= 0:
+            return []
+        # Entries are kept in time order, so the newest are at the end
+        return self.entries[-count:][::-1]
 
     @property
     def total_duration_seconds(self) -> float:
         """Get total duration of all recordings."""
-        return sum(e.duration_seconds for e in self.entries)
+        return sum(map(_get_duration, self.entries))
 
     @property
     def total_bark_count(self) -> int:
         """Get total bark count across all recordings."""
-        return sum(e.detection.bark_count_in_clip for e in self.entries)
+        return sum(map(_get_bark_count, self.entries))
@@ -21,7 +21,7 @@ import numpy as np
 import structlog
 
 from woofalytics.config import EvidenceConfig
-from woofalytics.evidence.metadata import EvidenceMetadata, EvidenceIndex
+from woofalytics.evidence.metadata import DailyAggregate, EvidenceMetadata, EvidenceIndex
 
 if TYPE_CHECKING:
     from woofalytics.audio.capture import AsyncAudioCapture
@@ -323,6 +323,27 @@ class EvidenceStorage:
         """
         return self._index.get_by_date_range(start, end)
 
+    def get_daily_aggregates(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> list[DailyAggregate]:
+        """Get per-day bark aggregates for a range of whole UTC days.
+
+        Args:
+            start: Start of range (UTC midnight, inclusive).
+            end: End of range (UTC midnight, exclusive).
+
+        Returns:
+            DailyAggregate for each day in the range that has evidence.
+        """
+        return self._index.get_daily_aggregates(start.date(), end.date())
+
+    @property
+    def last_updated(self) -> datetime:
+        """Get when the evidence index last changed."""
+        return self._index.last_updated
+
     @property
     def total_recordings(self) -> int:
         """Get total number of evidence recordings."""
@@ -383,7 +404,7 @@ class EvidenceStorage:
                 else:
                     entries_to_keep.append(entry)
 
-            self._index.entries = entries_to_keep
+            self._index.replace_entries(entries_to_keep)
             await self._save_index()
 
         logger.info("evidence_cleanup_complete", removed=removed)
@@ -441,7 +462,7 @@ class EvidenceStorage:
                 else:
                     entries_to_keep.append(entry)
 
-            self._index.entries = entries_to_keep
+            self._index.replace_entries(entries_to_keep)
             await self._save_index()
 
         logger.info("evidence_purge_complete", removed=removed)
@@ -472,7 +493,7 @@ class EvidenceStorage:
                 except Exception as e:
                     logger.warning("evidence_purge_error", filename=entry.filename, error=str(e))
 
-            self._index.entries = []
+            self._index.replace_entries([])
             await self._save_index()
 
         logger.warning("all_evidence_purged", removed=removed)
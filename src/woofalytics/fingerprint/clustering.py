@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -74,6 +75,29 @@ class ClusterSuggestion:
         }
 
 
+def _pairwise_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean distances between the rows of a and the rows of b."""
+    sq = (a * a).sum(axis=1)[:, None] + (b * b).sum(axis=1)[None, :] - 2.0 * (a @ b.T)
+    return np.sqrt(np.maximum(sq, 0.0))
+
+
+def _cluster_reach(embeddings: np.ndarray, labels: np.ndarray, chunk_size: int = 256) -> np.ndarray:
+    """Largest member-to-nearest-fellow-member distance of each cluster.
+
+    Indexed by cluster label. Distances are taken a block of rows at a time,
+    so memory stays at chunk_size x cluster size rather than the full square.
+    """
+    reach = np.zeros(int(labels.max()) + 1 if len(labels) else 0)
+    for label in range(len(reach)):
+        members = embeddings[labels == label]
+        for start in range(0, len(members), chunk_size):
+            dists = _pairwise_distances(members[start:start + chunk_size], members)
+            # Exclude each row's distance to itself
+            dists[np.arange(len(dists)), np.arange(start, start + len(dists))] = np.inf
+            reach[label] = max(reach[label], float(dists.min(axis=1).max()))
+    return reach
+
+
 class BarkClusterer:
     """Cluster untagged bark fingerprints to suggest new dog profiles.
 
@@ -88,11 +112,16 @@ class BarkClusterer:
     MIN_SAMPLES = 2  # Core sample requirement
     CLUSTER_SELECTION_EPSILON = 0.1  # Stability threshold
 
+    # New untagged barks tolerated before a persisted model is refit;
+    # below this they are assigned with approximate_predict instead
+    REFIT_THRESHOLD = 50
+
     def __init__(
         self,
         store: FingerprintStore,
         min_cluster_size: int | None = None,
         min_samples: int | None = None,
+        model_path: Path | None = None,
     ) -> None:
         """Initialize the clusterer.
 
@@ -100,6 +129,8 @@ class BarkClusterer:
             store: Fingerprint storage for retrieving untagged barks.
             min_cluster_size: Minimum fingerprints to form a cluster.
             min_samples: Minimum samples for a point to be a core point.
+            model_path: Where to persist the fitted HDBSCAN model between
+                runs. If None, every run fits from scratch.
 
         Raises:
             ImportError: If hdbscan package is not installed.
@@ -113,6 +144,7 @@ class BarkClusterer:
         self._store = store
         self._min_cluster_size = min_cluster_size or self.MIN_CLUSTER_SIZE
         self._min_samples = min_samples or self.MIN_SAMPLES
+        self._model_path = model_path
         self._log = logger.bind(component="bark_clusterer")
 
     def cluster_untagged(
@@ -145,16 +177,7 @@ class BarkClusterer:
         # Build embedding matrix
         embeddings = np.array([fp.embedding for fp in valid_fps])
 
-        # Run HDBSCAN clustering
-        clusterer = hdbscan.HDBSCAN(
-            min_cluster_size=self._min_cluster_size,
-            min_samples=self._min_samples,
-            cluster_selection_epsilon=self.CLUSTER_SELECTION_EPSILON,
-            metric="euclidean",  # Embeddings are L2 normalized, so euclidean ~ cosine
-            cluster_selection_method="eom",  # Excess of mass for stability
-        )
-
-        cluster_labels = clusterer.fit_predict(embeddings)
+        cluster_labels, cluster_probabilities = self._assign_labels(valid_fps, embeddings)
 
         # Build suggestions from clusters
         suggestions = []
@@ -165,11 +188,7 @@ class BarkClusterer:
             mask = cluster_labels == label
             cluster_fps = [fp for fp, m in zip(valid_fps, mask) if m]
             cluster_embeddings = embeddings[mask]
-
-            # Get probabilities if available
-            probabilities = None
-            if hasattr(clusterer, "probabilities_"):
-                probabilities = clusterer.probabilities_[mask]
+            probabilities = cluster_probabilities[mask]
 
             suggestion = self._build_suggestion(
                 cluster_id=f"cluster_{label}",
@@ -191,6 +210,139 @@ class BarkClusterer:
 
         return suggestions
 
+    def _assign_labels(
+        self,
+        fingerprints: list[BarkFingerprint],
+        embeddings: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get a cluster label and membership probability for each fingerprint.
+
+        Reuses the persisted model when only a few barks are new: previously
+        fitted barks keep their labels and new ones join the cluster of their
+        nearest fitted bark if they lie within that cluster's reach.
+        Otherwise HDBSCAN is refit and the model saved.
+        """
+        model = self._load_model()
+        if model is not None:
+            known = {fp_id: i for i, fp_id in enumerate(model["ids"].tolist())}
+            new_idx = [i for i, fp in enumerate(fingerprints) if fp.id not in known]
+
+            if len(new_idx) <= self.REFIT_THRESHOLD:
+                labels = np.empty(len(fingerprints), dtype=int)
+                probabilities = np.empty(len(fingerprints))
+                for i, fp in enumerate(fingerprints):
+                    if fp.id in known:
+                        labels[i] = model["labels"][known[fp.id]]
+                        probabilities[i] = model["probabilities"][known[fp.id]]
+
+                if new_idx:
+                    new_labels, new_strengths = self._predict(model, embeddings[new_idx])
+                    labels[new_idx] = new_labels
+                    probabilities[new_idx] = new_strengths
+
+                self._log.debug(
+                    "clustering_model_reused",
+                    known_count=len(fingerprints) - len(new_idx),
+                    predicted_count=len(new_idx),
+                )
+                return labels, probabilities
+
+        # Run HDBSCAN clustering
+        clusterer = hdbscan.HDBSCAN(
+            min_cluster_size=self._min_cluster_size,
+            min_samples=self._min_samples,
+            cluster_selection_epsilon=self.CLUSTER_SELECTION_EPSILON,
+            metric="euclidean",  # Embeddings are L2 normalized, so euclidean ~ cosine
+            cluster_selection_method="eom",  # Excess of mass for stability
+        )
+
+        labels = clusterer.fit_predict(embeddings)
+        probabilities = clusterer.probabilities_
+
+        if self._model_path is not None:
+            fitted = embeddings.astype(np.float32)
+            self._save_model(
+                ids=np.array([fp.id for fp in fingerprints], dtype=str),
+                embeddings=fitted,
+                labels=labels.astype(np.int64),
+                probabilities=probabilities.astype(np.float64),
+                reach=_cluster_reach(fitted, labels),
+            )
+        return labels, probabilities
+
+    @staticmethod
+    def _predict(
+        model: dict[str, np.ndarray],
+        embeddings: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Place new barks into the persisted clusters.
+
+        A bark takes the label of its nearest fitted bark when that bark is
+        clustered and no further away than that cluster's reach, saved when
+        the model was fit; otherwise it is noise (-1).
+        """
+        fitted = model["embeddings"]
+        fitted_labels = model["labels"]
+        reach = model["reach"]
+
+        dists = _pairwise_distances(embeddings, fitted)
+        nearest = dists.argmin(axis=1)
+        nearest_dist = dists[np.arange(len(embeddings)), nearest]
+
+        labels = np.full(len(embeddings), -1, dtype=int)
+        strengths = np.zeros(len(embeddings))
+        for i, (j, dist) in enumerate(zip(nearest, nearest_dist)):
+            label = int(fitted_labels[j])
+            if label != -1 and dist <= reach[label]:
+                labels[i] = label
+                strengths[i] = model["probabilities"][j]
+        return labels, strengths
+
+    def _load_model(self) -> dict[str, np.ndarray] | None:
+        """Load the persisted model if it was fit with the current parameters.
+
+        The file holds plain numeric and string arrays only and is read with
+        allow_pickle=False, so a tampered file cannot execute code.
+        """
+        if self._model_path is None or not self._model_path.exists():
+            return None
+
+        try:
+            with np.load(self._model_path, allow_pickle=False) as data:
+                model = {key: data[key] for key in data.files}
+            params = tuple(int(p) for p in model["params"])
+            lengths = {len(model[key]) for key in ("ids", "embeddings", "labels", "probabilities")}
+            labels_covered = len(model["reach"]) > int(model["labels"].max(initial=-1))
+        except Exception as e:
+            self._log.warning("clustering_model_load_failed", error=str(e))
+            return None
+
+        if (
+            params != (self._min_cluster_size, self._min_samples)
+            or len(lengths) != 1
+            or not labels_covered
+        ):
+            return None
+        return model
+
+    def _save_model(self, **arrays: np.ndarray) -> None:
+        """Persist a fitted model's arrays for reuse by later runs."""
+        if self._model_path is None:
+            return
+
+        try:
+            # np.savez appends .npz to names without it, so write through a file object
+            tmp_path = self._model_path.with_suffix(".tmp")
+            with tmp_path.open("wb") as f:
+                np.savez(
+                    f,
+                    params=np.array([self._min_cluster_size, self._min_samples]),
+                    **arrays,
+                )
+            tmp_path.replace(self._model_path)
+        except Exception as e:
+            self._log.warning("clustering_model_save_failed", error=str(e))
+
     def _build_suggestion(
         self,
         cluster_id: str,
@@ -319,6 +471,7 @@ def create_clusterer(
     store: FingerprintStore,
     min_cluster_size: int = 3,
     min_samples: int = 2,
+    model_path: Path | None = None,
 ) -> BarkClusterer:
     """Create a bark clusterer instance.
 
@@ -326,6 +479,7 @@ def create_clusterer(
         store: Fingerprint storage instance.
         min_cluster_size: Minimum barks to form a cluster.
         min_samples: Minimum samples for a point to be core point.
+        model_path: Optional file to persist the fitted model between runs.
 
     Returns:
         Configured BarkClusterer.
@@ -337,6 +491,7 @@ def create_clusterer(
         store,
         min_cluster_size=min_cluster_size,
         min_samples=min_samples,
+        model_path=model_path,
     )
 
 
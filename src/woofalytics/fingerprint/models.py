@@ -150,6 +150,19 @@ class DogProfile:
 
         self.updated_at = datetime.now(timezone.utc)
 
+    def update_embedding_batch(self, new_embeddings: np.ndarray) -> None:
+        """Update cumulative embedding with several samples in order.
+
+        Applies update_embedding to each sample, so the centroid (which is
+        re-normalized after every sample) is the same as updating one
+        sample at a time.
+
+        Args:
+            new_embeddings: Stacked CLAP embeddings, shape (N, 512).
+        """
+        for new_embedding in new_embeddings:
+            self.update_embedding(new_embedding)
+
 
 @dataclass
 class BarkFingerprint:
@@ -26,6 +26,10 @@ logger = structlog.get_logger(__name__)
 # CLAP embedding dimension
 EMBEDDING_DIM = 512
 
+# Fitted clustering model, kept next to the database and discarded whenever
+# barks are untagged, merged or deleted
+CLUSTERER_MODEL_FILENAME = "clusterer.npz"
+
 
 def _row_to_fingerprint(row: sqlite3.Row) -> BarkFingerprint:
     """Convert a database row to a BarkFingerprint model."""
@@ -70,21 +74,52 @@ def _row_to_dog_profile(row: sqlite3.Row) -> DogProfile:
     )
 
 # Schema version for migrations
-SCHEMA_VERSION = 4
+SCHEMA_VERSION = 5
+
+
+# Applied to every connection. WAL (set once, it persists in the file) makes
+# synchronous=NORMAL safe; temp B-trees for GROUP BY/ORDER BY stay in memory,
+# and reads are served from a memory map instead of read() syscalls.
+# recursive_triggers makes INSERT OR REPLACE fire the rollup's delete trigger
+# for the replaced row.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA recursive_triggers = ON",
+)
+
 
+# Embeddings are unit-normalized, so float16 keeps ample precision for cosine
+# similarity and centroid averaging while halving BLOB size on disk
+EMBEDDING_STORAGE_DTYPE = np.float16
 
-def _serialize_embedding(arr: np.ndarray | None) -> bytes | None:
+
+def _serialize_embedding(
+    arr: np.ndarray | None,
+    dtype: type[np.floating] = EMBEDDING_STORAGE_DTYPE,
+) -> bytes | None:
     """Serialize numpy array to bytes for SQLite storage."""
     if arr is None:
         return None
-    return arr.astype(np.float32).tobytes()
+    return np.asarray(arr).astype(dtype).tobytes()
 
 
 def _deserialize_embedding(data: bytes | None, shape: tuple[int, ...] = (EMBEDDING_DIM,)) -> np.ndarray | None:
-    """Deserialize bytes to numpy array."""
+    """Deserialize bytes to a float32 numpy array.
+
+    The storage dtype is inferred from the BLOB size, so rows written as
+    float32 before the switch to float16 storage still load correctly.
+    """
     if data is None:
         return None
-    return np.frombuffer(data, dtype=np.float32).reshape(shape)
+    dtype = np.float16 if len(data) == 2 * int(np.prod(shape)) else np.float32
+    return np.frombuffer(data, dtype=dtype).reshape(shape).astype(np.float32, copy=False)
+
+
+# Cached AI summaries kept before the oldest are pruned. Prompts for the
+# current week change with every new bark, so superseded rows accumulate.
+MAX_CACHED_SUMMARIES = 500
 
 
 class FingerprintStore:
@@ -104,11 +139,25 @@ class FingerprintStore:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_schema()
 
+    @property
+    def clusterer_model_path(self) -> Path:
+        """Where the fitted clustering model for this database is persisted."""
+        return self.db_path.with_name(CLUSTERER_MODEL_FILENAME)
+
+    def _invalidate_clusterer_model(self) -> None:
+        """Delete the persisted clustering model after labelled data changes."""
+        try:
+            self.clusterer_model_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("clusterer_model_delete_failed", error=str(e))
+
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
         """Get a database connection with proper cleanup."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         try:
             yield conn
         finally:
@@ -119,6 +168,9 @@ class FingerprintStore:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
+            # Readers no longer block on the fingerprint writer thread
+            cursor.execute("PRAGMA journal_mode = WAL")
+
             # Dog profiles table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS dog_profiles (
@@ -161,6 +213,62 @@ class FingerprintStore:
                 )
             """)
 
+            # Tagged bark counts per UTC day and dog, kept current by the triggers
+            # below so per-dog summaries never scan bark_fingerprints
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_dog_rollup (
+                    day TEXT NOT NULL,
+                    dog_id TEXT NOT NULL,
+                    bark_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (day, dog_id)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_rollup_insert
+                AFTER INSERT ON bark_fingerprints
+                WHEN NEW.dog_id IS NOT NULL
+                BEGIN
+                    INSERT INTO daily_dog_rollup (day, dog_id, bark_count)
+                    VALUES (date(NEW.timestamp), NEW.dog_id, 1)
+                    ON CONFLICT (day, dog_id) DO UPDATE SET bark_count = bark_count + 1;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_rollup_delete
+                AFTER DELETE ON bark_fingerprints
+                WHEN OLD.dog_id IS NOT NULL
+                BEGIN
+                    UPDATE daily_dog_rollup SET bark_count = bark_count - 1
+                    WHERE day = date(OLD.timestamp) AND dog_id = OLD.dog_id;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_rollup_update
+                AFTER UPDATE OF dog_id, timestamp ON bark_fingerprints
+                WHEN OLD.dog_id IS NOT NEW.dog_id OR OLD.timestamp IS NOT NEW.timestamp
+                BEGIN
+                    UPDATE daily_dog_rollup SET bark_count = bark_count - 1
+                    WHERE OLD.dog_id IS NOT NULL
+                      AND day = date(OLD.timestamp) AND dog_id = OLD.dog_id;
+                    INSERT INTO daily_dog_rollup (day, dog_id, bark_count)
+                    SELECT date(NEW.timestamp), NEW.dog_id, 1
+                    WHERE NEW.dog_id IS NOT NULL
+                    ON CONFLICT (day, dog_id) DO UPDATE SET bark_count = bark_count + 1;
+                END
+            """)
+
+            # Generated AI summaries keyed by a hash of (prompt, model). The prompt
+            # embeds all of the period's data, so a changed period gets a new key.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS ai_summary_cache (
+                    prompt_hash TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    generated_at TEXT NOT NULL,
+                    generation_time_ms INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
             # Note: clusters table kept for backwards compatibility but not actively used
             # The ClusterInfo model was removed as YAGNI - clustering feature was never implemented
 
@@ -238,12 +346,59 @@ class FingerprintStore:
                     pass
                 cursor.execute("UPDATE schema_version SET version = 4 WHERE id = 1")
                 logger.info("schema_migrated", from_version=current_version, to_version=4)
+                current_version = 4
 
-            # Indexes for common queries
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_dog_id ON bark_fingerprints(dog_id)")
+            if current_version < 5:
+                # Migration: Backfill the per-day dog rollup from existing fingerprints
+                cursor.execute("DELETE FROM daily_dog_rollup")
+                cursor.execute("""
+                    INSERT INTO daily_dog_rollup (day, dog_id, bark_count)
+                    SELECT date(timestamp), dog_id, COUNT(*)
+                    FROM bark_fingerprints
+                    WHERE dog_id IS NOT NULL
+                    GROUP BY date(timestamp), dog_id
+                """)
+                cursor.execute("UPDATE schema_version SET version = 5 WHERE id = 1")
+                logger.info("schema_migrated", from_version=current_version, to_version=5)
+
+            # Indexes for common queries. The list queries all ORDER BY timestamp DESC,
+            # so each filter gets an index that also yields rows in timestamp order.
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_timestamp ON bark_fingerprints(timestamp)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_untagged ON bark_fingerprints(dog_id) WHERE dog_id IS NULL")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_rejected ON bark_fingerprints(rejection_reason) WHERE rejection_reason IS NOT NULL")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_fingerprints_dog_timestamp ON bark_fingerprints(dog_id, timestamp DESC)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_fingerprints_untagged_timestamp ON bark_fingerprints(timestamp DESC) "
+                "WHERE dog_id IS NULL AND rejection_reason IS NULL"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_fingerprints_rejected_timestamp ON bark_fingerprints(timestamp DESC) "
+                "WHERE rejection_reason IS NOT NULL"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_fingerprints_confidence ON bark_fingerprints(match_confidence) "
+                "WHERE match_confidence IS NOT NULL"
+            )
+            # Lets per-dog summaries start from confirmed dogs, in id order
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_dogs_confirmed ON dog_profiles(confirmed, id)"
+            )
+            # Covering index for those per-dog probes into the day-keyed rollup
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_rollup_dog_day ON daily_dog_rollup(dog_id, day, bark_count)"
+            )
+
+            # Superseded by the timestamp-ordered indexes above
+            cursor.execute("DROP INDEX IF EXISTS idx_fingerprints_dog_id")
+            cursor.execute("DROP INDEX IF EXISTS idx_fingerprints_dog_rejection")
+            cursor.execute("DROP INDEX IF EXISTS idx_fingerprints_untagged")
+            cursor.execute("DROP INDEX IF EXISTS idx_fingerprints_rejected")
+
+            # Give the query planner statistics: full ANALYZE once, then let
+            # SQLite refresh only what has drifted on later startups
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'")
+            if cursor.fetchone():
+                cursor.execute("PRAGMA optimize")
+            else:
+                cursor.execute("ANALYZE")
 
             conn.commit()
 
@@ -444,6 +599,7 @@ class FingerprintStore:
             conn.commit()
 
         if deleted:
+            self._invalidate_clusterer_model()
             logger.info("dog_profile_deleted", dog_id=dog_id)
 
         return deleted
@@ -503,6 +659,65 @@ class FingerprintStore:
             )
             conn.commit()
 
+    def update_dog_stats_batch(
+        self,
+        dog_id: str,
+        embeddings: np.ndarray,
+        timestamps: list[datetime],
+    ) -> None:
+        """Update dog profile with several new bark samples in one write.
+
+        Applies the same per-sample embedding update as update_dog_stats,
+        but the profile is read once and the row is written with one UPDATE.
+        The centroid matches sequential update_dog_stats calls up to the
+        float16 storage rounding those calls apply between samples.
+
+        Args:
+            dog_id: The dog's unique ID.
+            embeddings: Stacked CLAP embeddings, shape (N, 512).
+            timestamps: Detection time for each embedding.
+        """
+        if len(embeddings) == 0:
+            return
+
+        profile = self.get_dog(dog_id)
+        if not profile:
+            return
+
+        profile.update_embedding_batch(embeddings)
+
+        earliest = min(timestamps)
+        latest = max(timestamps)
+        if profile.first_seen is None or earliest < profile.first_seen:
+            profile.first_seen = earliest
+        if profile.last_seen is None or latest > profile.last_seen:
+            profile.last_seen = latest
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE dog_profiles SET
+                    embedding = ?,
+                    sample_count = ?,
+                    first_seen = ?,
+                    last_seen = ?,
+                    total_barks = total_barks + ?,
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    _serialize_embedding(profile.embedding),
+                    profile.sample_count,
+                    profile.first_seen.isoformat() if profile.first_seen else None,
+                    profile.last_seen.isoformat() if profile.last_seen else None,
+                    len(embeddings),
+                    datetime.now(timezone.utc).isoformat(),
+                    dog_id,
+                ),
+            )
+            conn.commit()
+
     def confirm_dog(self, dog_id: str, min_samples: int | None = None) -> DogProfile | None:
         """Confirm a dog for auto-tagging.
 
@@ -667,7 +882,7 @@ class FingerprintStore:
                     fingerprint.duration_ms,
                     fingerprint.pitch_hz,
                     fingerprint.spectral_centroid_hz,
-                    _serialize_embedding(fingerprint.mfcc_mean) if fingerprint.mfcc_mean is not None else None,
+                    _serialize_embedding(fingerprint.mfcc_mean, np.float32) if fingerprint.mfcc_mean is not None else None,
                 ),
             )
             conn.commit()
@@ -720,6 +935,66 @@ class FingerprintStore:
 
         return fingerprints
 
+    def list_untagged_fingerprints(self, limit: int = 100) -> tuple[list[BarkFingerprint], int]:
+        """Get untagged fingerprints together with the total untagged count.
+
+        The total is a single COUNT answered from the partial untagged index,
+        rather than the five counts of get_stats().
+
+        Args:
+            limit: Maximum number to return.
+
+        Returns:
+            Tuple of (list of untagged fingerprints, total untagged count).
+        """
+        fingerprints = self.get_untagged_fingerprints(limit=limit)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Left to itself the planner probes (dog_id, timestamp) and reads
+            # every untagged row to check rejection_reason; the partial index
+            # holds exactly the rows to count
+            cursor.execute(
+                """
+                SELECT COUNT(*) FROM bark_fingerprints
+                INDEXED BY idx_fingerprints_untagged_timestamp
+                WHERE dog_id IS NULL AND rejection_reason IS NULL
+                """
+            )
+            total = cursor.fetchone()[0]
+
+        return fingerprints, total
+
+    def filter_untagged_ids(self, fingerprint_ids: list[str]) -> list[str]:
+        """Keep only the IDs whose fingerprints are still untagged.
+
+        Fingerprints that have since been tagged, rejected or deleted are
+        dropped. The input order is preserved.
+
+        Args:
+            fingerprint_ids: Fingerprint IDs to check.
+
+        Returns:
+            The subset of fingerprint_ids that are untagged and not rejected.
+        """
+        if not fingerprint_ids:
+            return []
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" * len(fingerprint_ids))
+            cursor.execute(
+                f"""
+                SELECT id FROM bark_fingerprints
+                WHERE id IN ({placeholders})
+                  AND dog_id IS NULL AND rejection_reason IS NULL
+                """,
+                fingerprint_ids,
+            )
+            untagged = {row["id"] for row in cursor.fetchall()}
+
+        return [fp_id for fp_id in fingerprint_ids if fp_id in untagged]
+
     def tag_fingerprint(self, fingerprint_id: str, dog_id: str, confidence: float) -> bool:
         """Tag a fingerprint as belonging to a dog.
 
@@ -768,6 +1043,9 @@ class FingerprintStore:
             updated = cursor.rowcount > 0
             conn.commit()
 
+        if updated:
+            self._invalidate_clusterer_model()
+
         return updated
 
     def reject_fingerprint(self, fingerprint_id: str, reason: str) -> bool:
@@ -824,6 +1102,7 @@ class FingerprintStore:
             conn.commit()
 
         if updated:
+            self._invalidate_clusterer_model()
             logger.info("fingerprint_unrejected", fingerprint_id=fingerprint_id)
 
         return updated
@@ -1072,6 +1351,7 @@ class FingerprintStore:
             cursor.execute("DELETE FROM dog_profiles WHERE id = ?", (source_id,))
             conn.commit()
 
+        self._invalidate_clusterer_model()
         logger.info("dogs_merged", source_id=source_id, target_id=target_id)
         return True
 
@@ -1166,6 +1446,10 @@ class FingerprintStore:
     def get_dog_acoustic_aggregates(self) -> list[dict]:
         """Get aggregate acoustic statistics per dog.
 
+        All dogs are aggregated in a single grouped query that probes each
+        dog's fingerprints through the (dog_id, timestamp) index. Rejected
+        fingerprints are excluded.
+
         Returns:
             List of dictionaries with per-dog acoustic statistics.
         """
@@ -1187,7 +1471,7 @@ class FingerprintStore:
                     MIN(f.timestamp) as first_seen,
                     MAX(f.timestamp) as last_seen
                 FROM dog_profiles d
-                LEFT JOIN bark_fingerprints f ON d.id = f.dog_id
+                LEFT JOIN bark_fingerprints f ON d.id = f.dog_id AND f.rejection_reason IS NULL
                 GROUP BY d.id, d.name
                 ORDER BY d.name
             """)
@@ -1302,6 +1586,7 @@ class FingerprintStore:
             conn.commit()
 
         if deleted:
+            self._invalidate_clusterer_model()
             logger.info("fingerprint_deleted", fingerprint_id=fingerprint_id)
 
         return deleted
@@ -1352,6 +1637,7 @@ class FingerprintStore:
             if count > 0:
                 cursor.execute(f"DELETE FROM bark_fingerprints WHERE {where_clause}", params)
                 conn.commit()
+                self._invalidate_clusterer_model()
                 logger.info(
                     "fingerprints_purged",
                     count=count,
@@ -1426,6 +1712,64 @@ class FingerprintStore:
             if count > 0:
                 cursor.execute("DELETE FROM bark_fingerprints")
                 conn.commit()
+                self._invalidate_clusterer_model()
                 logger.warning("all_fingerprints_purged", count=count)
 
         return count
+
+    # --- AI Summary Cache ---
+
+    def get_cached_summary(self, prompt_hash: str) -> str | None:
+        """Look up a previously generated AI summary.
+
+        Args:
+            prompt_hash: Hash of the prompt and model that produced the summary.
+
+        Returns:
+            The cached summary text, or None if not cached.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT summary FROM ai_summary_cache WHERE prompt_hash = ?",
+                (prompt_hash,),
+            )
+            row = cursor.fetchone()
+
+        return row["summary"] if row else None
+
+    def cache_summary(
+        self,
+        prompt_hash: str,
+        model: str,
+        summary: str,
+        generation_time_ms: int,
+    ) -> None:
+        """Store a generated AI summary, pruning the oldest beyond the cap.
+
+        Args:
+            prompt_hash: Hash of the prompt and model that produced the summary.
+            model: Name of the model that generated the summary.
+            summary: The generated summary text.
+            generation_time_ms: How long generation took.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO ai_summary_cache
+                    (prompt_hash, model, summary, generated_at, generation_time_ms)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (prompt_hash, model, summary, datetime.now(timezone.utc).isoformat(), generation_time_ms),
+            )
+            cursor.execute(
+                """
+                DELETE FROM ai_summary_cache WHERE prompt_hash NOT IN (
+                    SELECT prompt_hash FROM ai_summary_cache
+                    ORDER BY generated_at DESC LIMIT ?
+                )
+                """,
+                (MAX_CACHED_SUMMARIES,),
+            )
+            conn.commit()
@@ -5,7 +5,8 @@ This module provides comprehensive tests for all FastAPI REST endpoints.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, patch, AsyncMock
@@ -172,6 +173,9 @@ def mock_fingerprint_store() -> MagicMock:
     mock_fingerprint.match_confidence = 0.95
     mock_fingerprint.cluster_id = None
     mock_fingerprint.evidence_filename = "bark_20260106_120000.wav"
+    mock_fingerprint.rejection_reason = None
+    mock_fingerprint.confirmed = None
+    mock_fingerprint.confirmed_at = None
     mock_fingerprint.detection_probability = 0.95
     mock_fingerprint.doa_degrees = 90
     mock_fingerprint.duration_ms = 250.0
@@ -182,6 +186,7 @@ def mock_fingerprint_store() -> MagicMock:
     store.get_fingerprint.return_value = mock_fingerprint
     store.get_fingerprints_for_dog.return_value = [mock_fingerprint]
     store.get_untagged_fingerprints.return_value = []
+    store.list_untagged_fingerprints.return_value = ([], 20)
     store.tag_fingerprint.return_value = True
     store.untag_fingerprint.return_value = True
     store.list_fingerprints.return_value = ([mock_fingerprint], 1)
@@ -210,6 +215,7 @@ def mock_fingerprint_store() -> MagicMock:
     store.delete_fingerprint.return_value = True
     store.purge_fingerprints.return_value = 5
     store.recalculate_dog_bark_counts.return_value = 3
+    store.filter_untagged_ids.side_effect = lambda ids: list(ids)
 
     return store
 
@@ -238,6 +244,7 @@ def api_client(
     app.state.detector = mock_detector
     app.state.evidence = mock_evidence
     app.state.fingerprint_store = mock_fingerprint_store
+    app.state.cluster_runs = OrderedDict()
     app.state.ws_manager = ConnectionManager()
 
     with TestClient(app) as client:
@@ -458,6 +465,17 @@ class TestEvidenceEndpoints:
         data = response.json()
         assert data["count"] == 1
 
+    def test_get_evidence_by_date_queries_utc_day(
+        self,
+        api_client: TestClient,
+        mock_evidence: MagicMock,
+    ) -> None:
+        """Test that the date is resolved to a timezone-aware UTC day."""
+        api_client.get("/api/evidence/date/2026-01-06")
+
+        start = datetime(2026, 1, 6, tzinfo=timezone.utc)
+        mock_evidence.get_evidence_by_date.assert_called_with(start, start + timedelta(days=1))
+
     def test_get_evidence_by_date_invalid(self, api_client: TestClient) -> None:
         """Test getting evidence with invalid date format."""
         response = api_client.get("/api/evidence/date/invalid-date")
@@ -493,6 +511,33 @@ class TestConfigEndpoint:
         assert "directory" not in data["evidence"]
 
 
+class TestSettingsEndpoint:
+    """Tests for /api/settings endpoint."""
+
+    def test_get_settings_sets_etag(self, api_client: TestClient) -> None:
+        """Test settings response carries an ETag."""
+        response = api_client.get("/api/settings")
+        assert response.status_code == 200
+        assert response.headers["etag"]
+        assert set(response.json()["settings"]) == {"model", "evidence", "webhook", "quiet_hours"}
+
+    def test_get_settings_not_modified(self, api_client: TestClient) -> None:
+        """Test matching If-None-Match returns 304 without a body."""
+        etag = api_client.get("/api/settings").headers["etag"]
+
+        response = api_client.get("/api/settings", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_get_settings_stale_etag(self, api_client: TestClient) -> None:
+        """Test a non-matching If-None-Match returns the full body."""
+        response = api_client.get("/api/settings", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert "settings" in response.json()
+
+
 # --- Direction Tests ---
 
 
@@ -804,6 +849,103 @@ class TestFingerprintEndpoints:
         assert data["dogs"][0]["dog_name"] == "Buddy"
 
 
+# --- Clustering Tests ---
+
+
+class TestClusteringEndpoints:
+    """Tests for clustering endpoints."""
+
+    @pytest.fixture
+    def mock_clusterer(self) -> Generator[MagicMock, None, None]:
+        """Patch clustering so no HDBSCAN run is needed."""
+        from woofalytics.fingerprint.clustering import ClusterSuggestion
+
+        clusterer = MagicMock()
+        clusterer.cluster_untagged.return_value = [
+            ClusterSuggestion(
+                cluster_id="cluster_0",
+                fingerprint_ids=["fp-001", "fp-002", "fp-003"],
+                size=3,
+                coherence_score=0.9,
+            )
+        ]
+        clusterer.get_cluster_samples.return_value = ["fp-001"]
+        clusterer.create_dog_from_cluster.return_value = "dog-001"
+
+        with (
+            patch("woofalytics.api.routes_fingerprint.is_clustering_available", return_value=True),
+            patch("woofalytics.api.routes_fingerprint.create_clusterer", return_value=clusterer),
+        ):
+            yield clusterer
+
+    def test_create_dog_uses_cached_run(
+        self,
+        api_client: TestClient,
+        mock_clusterer: MagicMock,
+    ) -> None:
+        """Test creating a dog reuses the clustering run instead of re-clustering."""
+        response = api_client.post("/api/fingerprints/cluster")
+        assert response.status_code == 200
+        run_id = response.json()["run_id"]
+
+        response = api_client.post(
+            "/api/fingerprints/cluster/cluster_0/create-dog",
+            json={"name": "Rex", "run_id": run_id},
+        )
+        assert response.status_code == 201
+        assert mock_clusterer.cluster_untagged.call_count == 1
+        mock_clusterer.create_dog_from_cluster.assert_called_once()
+
+    def test_create_dog_expired_run(
+        self,
+        api_client: TestClient,
+        mock_clusterer: MagicMock,
+    ) -> None:
+        """Test creating a dog from an unknown clustering run."""
+        response = api_client.post(
+            "/api/fingerprints/cluster/cluster_0/create-dog",
+            json={"name": "Rex", "run_id": "unknown"},
+        )
+        assert response.status_code == 410
+        mock_clusterer.create_dog_from_cluster.assert_not_called()
+
+    def test_create_dog_skips_barks_tagged_since_run(
+        self,
+        api_client: TestClient,
+        mock_clusterer: MagicMock,
+        mock_fingerprint_store: MagicMock,
+    ) -> None:
+        """Test barks tagged after clustering are not moved to the new dog."""
+        run_id = api_client.post("/api/fingerprints/cluster").json()["run_id"]
+        mock_fingerprint_store.filter_untagged_ids.side_effect = lambda ids: ["fp-001", "fp-003"]
+
+        response = api_client.post(
+            "/api/fingerprints/cluster/cluster_0/create-dog",
+            json={"name": "Rex", "run_id": run_id},
+        )
+        assert response.status_code == 201
+        suggestion = mock_clusterer.create_dog_from_cluster.call_args.args[0]
+        assert suggestion.fingerprint_ids == ["fp-001", "fp-003"]
+        assert suggestion.size == 2
+
+    def test_create_dog_conflict_when_all_barks_tagged(
+        self,
+        api_client: TestClient,
+        mock_clusterer: MagicMock,
+        mock_fingerprint_store: MagicMock,
+    ) -> None:
+        """Test a cluster whose barks were all tagged since clustering is refused."""
+        run_id = api_client.post("/api/fingerprints/cluster").json()["run_id"]
+        mock_fingerprint_store.filter_untagged_ids.side_effect = lambda ids: []
+
+        response = api_client.post(
+            "/api/fingerprints/cluster/cluster_0/create-dog",
+            json={"name": "Rex", "run_id": run_id},
+        )
+        assert response.status_code == 409
+        mock_clusterer.create_dog_from_cluster.assert_not_called()
+
+
 # --- Maintenance Tests ---
 
 
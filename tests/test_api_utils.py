@@ -0,0 +1,52 @@
+"""Tests for helpers shared by the API routers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from woofalytics.api.utils import etag_matches, parse_year_month, parse_ymd
+
+
+class TestParseYmd:
+    """Tests for YYYY-MM-DD parsing."""
+
+    def test_parses_to_utc_midnight(self):
+        """Test a valid date parses to UTC midnight."""
+        assert parse_ymd("2026-01-05") == datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("value", ["2026-1-05", "2026/01/05", "2026-01-5x", "2026-02-30"])
+    def test_rejects_invalid_dates(self, value: str):
+        """Test malformed or impossible dates raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_ymd(value)
+
+
+class TestParseYearMonth:
+    """Tests for YYYY-MM parsing."""
+
+    def test_parses_year_and_month(self):
+        """Test a valid month parses to a (year, month) tuple."""
+        assert parse_year_month("2026-01") == (2026, 1)
+
+    @pytest.mark.parametrize("value", ["2026-1", "2026-13", "2026-00", "2026/01"])
+    def test_rejects_invalid_months(self, value: str):
+        """Test malformed or out-of-range months raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_year_month(value)
+
+
+class TestEtagMatches:
+    """Tests for If-None-Match comparison."""
+
+    def test_weak_and_listed_tags_match(self):
+        """Test weak tags and tags in a list match the strong ETag."""
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"xyz", "abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+
+    def test_missing_or_different_tags_do_not_match(self):
+        """Test an absent header or different tag does not match."""
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"xyz"', '"abc"')
@@ -167,8 +167,11 @@ class TestConnectionManager:
         message = {"type": "test", "data": "hello"}
         await connection_manager.broadcast(message)
 
-        mock_ws1.send_json.assert_called_once_with(message)
-        mock_ws2.send_json.assert_called_once_with(message)
+        mock_ws1.send_text.assert_called_once()
+        payload = mock_ws1.send_text.call_args[0][0]
+        assert json.loads(payload) == message
+        # Serialized once, same frame for every client
+        mock_ws2.send_text.assert_called_once_with(payload)
 
     @pytest.mark.asyncio
     async def test_broadcast_removes_failed_connections(
@@ -180,7 +183,7 @@ class TestConnectionManager:
         mock_ws2 = AsyncMock(spec=WebSocket)
 
         # First connection succeeds, second fails
-        mock_ws2.send_json.side_effect = Exception("Connection lost")
+        mock_ws2.send_text.side_effect = Exception("Connection lost")
 
         await connection_manager.connect(mock_ws1)
         await connection_manager.connect(mock_ws2)
@@ -193,6 +196,56 @@ class TestConnectionManager:
         assert mock_ws1 in connection_manager.active_connections
         assert mock_ws2 not in connection_manager.active_connections
 
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_concurrently(
+        self,
+        connection_manager: ConnectionManager,
+    ) -> None:
+        """Test that a blocked client does not hold up the others."""
+        reached_second = asyncio.Event()
+        slow_ws = AsyncMock(spec=WebSocket)
+        fast_ws = AsyncMock(spec=WebSocket)
+
+        async def wait_for_second(_: str) -> None:
+            await reached_second.wait()
+
+        async def signal_second(_: str) -> None:
+            reached_second.set()
+
+        slow_ws.send_text.side_effect = wait_for_second
+        fast_ws.send_text.side_effect = signal_second
+
+        await connection_manager.connect(slow_ws)
+        await connection_manager.connect(fast_ws)
+
+        # Sequential sends would wait on the first client forever
+        await asyncio.wait_for(connection_manager.broadcast({"type": "test"}), timeout=1.0)
+
+        assert connection_manager.connection_count == 2
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_stalled_client(
+        self,
+        connection_manager: ConnectionManager,
+    ) -> None:
+        """Test that a client whose send never completes is timed out and dropped."""
+        stalled_ws = AsyncMock(spec=WebSocket)
+        healthy_ws = AsyncMock(spec=WebSocket)
+
+        async def never_complete(_: str) -> None:
+            await asyncio.Event().wait()
+
+        stalled_ws.send_text.side_effect = never_complete
+
+        await connection_manager.connect(stalled_ws)
+        await connection_manager.connect(healthy_ws)
+
+        with patch("woofalytics.api.websocket.BROADCAST_SEND_TIMEOUT_SECONDS", 0.05):
+            await asyncio.wait_for(connection_manager.broadcast({"type": "test"}), timeout=1.0)
+
+        healthy_ws.send_text.assert_called_once()
+        assert connection_manager.active_connections == {healthy_ws}
+
     @pytest.mark.asyncio
     async def test_send_personal_success(
         self,
@@ -329,8 +382,8 @@ class TestBroadcastBarkEvent:
 
         await broadcast_bark_event(event, manager)
 
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_text.assert_called_once()
+        call_args = json.loads(mock_ws.send_text.call_args[0][0])
         assert call_args["type"] == "bark_event"
 
     @pytest.mark.asyncio
@@ -390,6 +443,15 @@ class TestWebSocketBarkEndpoint:
             data = websocket.receive_json()
             assert data["type"] == "pong"
 
+    def test_bark_ws_pings_idle_client(self, ws_client: TestClient) -> None:
+        """Test an idle client is pinged so dead peers get dropped."""
+        with patch("woofalytics.api.websocket.BARK_IDLE_PING_SECONDS", 0.05):
+            with ws_client.websocket_connect("/ws/bark") as websocket:
+                websocket.receive_json()
+
+                data = websocket.receive_json()
+                assert data["type"] == "ping"
+
 
 class TestWebSocketPipelineEndpoint:
     """Tests for /ws/pipeline WebSocket endpoint."""
@@ -411,9 +473,25 @@ class TestWebSocketPipelineEndpoint:
             data1 = websocket.receive_json()
             assert data1["type"] == "pipeline_state"
 
-            # Receive second message
+            # State is unchanged, so the next tick is a heartbeat
             data2 = websocket.receive_json()
-            assert data2["type"] == "pipeline_state"
+            assert data2 == {"type": "heartbeat"}
+
+    def test_pipeline_ws_sends_changed_keys(
+        self,
+        ws_client: TestClient,
+        mock_detector: MagicMock,
+    ) -> None:
+        """Test that later ticks carry only the top-level keys that changed."""
+        initial = mock_detector.get_pipeline_state.return_value
+        changed = {**initial, "stats": {**initial["stats"], "vad_skipped": 101}}
+        mock_detector.get_pipeline_state.side_effect = [initial, changed] + [changed] * 100
+
+        with ws_client.websocket_connect("/ws/pipeline") as websocket:
+            assert websocket.receive_json()["data"] == initial
+            delta = websocket.receive_json()
+
+        assert delta == {"type": "pipeline_delta", "data": {"stats": changed["stats"]}}
 
 
 class TestWebSocketAudioEndpoint:
@@ -445,6 +523,50 @@ class TestWebSocketAudioEndpoint:
             assert data1["type"] == "audio_level"
             assert data2["type"] == "audio_level"
 
+    def test_audio_ws_levels_from_frames(
+        self,
+        ws_client: TestClient,
+        mock_detector: MagicMock,
+    ) -> None:
+        """Test RMS level and peak computed from captured frames."""
+        import numpy as np
+
+        # Square wave at +/-1000: RMS and peak are both 1000
+        samples = np.tile(np.array([1000, -1000], dtype=np.int16), 480)
+        mock_detector.audio_capture = MagicMock()
+        mock_detector.audio_capture.get_recent_frames.return_value = [
+            MagicMock(data=samples.tobytes()),
+            MagicMock(data=samples.tobytes()),
+        ]
+
+        with ws_client.websocket_connect("/ws/audio") as websocket:
+            websocket.receive_json()  # Initial zeros
+            data = websocket.receive_json()["data"]
+
+        assert data["level"] == round(1000 / 32768 * 10, 3)
+        assert data["peak"] == round(1000 / 32768, 3)
+
+    def test_audio_ws_full_scale_negative_peak(
+        self,
+        ws_client: TestClient,
+        mock_detector: MagicMock,
+    ) -> None:
+        """Test that a clipped -32768 sample reports full-scale peak."""
+        import numpy as np
+
+        samples = np.zeros(960, dtype=np.int16)
+        samples[10] = -32768
+        mock_detector.audio_capture = MagicMock()
+        mock_detector.audio_capture.get_recent_frames.return_value = [
+            MagicMock(data=samples.tobytes()),
+        ]
+
+        with ws_client.websocket_connect("/ws/audio") as websocket:
+            websocket.receive_json()  # Initial zeros
+            data = websocket.receive_json()["data"]
+
+        assert data["peak"] == 1.0
+
 
 # --- Integration Tests ---
 
@@ -491,7 +613,8 @@ class TestWebSocketIntegration:
 
         # All should receive
         for conn in connections:
-            conn.send_json.assert_called_once_with(message)
+            conn.send_text.assert_called_once()
+            assert json.loads(conn.send_text.call_args[0][0]) == message
 
     @pytest.mark.asyncio
     async def test_thread_safety(self) -> None:
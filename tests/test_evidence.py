@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
@@ -210,3 +210,93 @@ class TestEvidenceIndex:
 
         assert len(loaded.entries) == 1
         assert loaded.entries[0].filename == "test.wav"
+
+    def test_get_by_date_range(self):
+        """Test range lookup on entries added out of order."""
+        index = EvidenceIndex()
+
+        for day in (7, 5, 6):
+            metadata = EvidenceMetadata.create(
+                filename=f"test_{day}.wav",
+                duration_seconds=10.0,
+                sample_rate=44100,
+                channels=2,
+                trigger_probability=0.88,
+                peak_probability=0.9,
+                bark_count=1,
+                microphone_name="Test Mic",
+            )
+            metadata.timestamp_utc = datetime(2026, 1, day, 12, 0, tzinfo=timezone.utc)
+            index.add(metadata)
+
+        result = index.get_by_date_range(
+            datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc),
+            datetime(2026, 1, 6, 12, 0, tzinfo=timezone.utc),
+        )
+
+        assert [e.filename for e in result] == ["test_5.wav", "test_6.wav"]
+
+    def test_bulk_daily_aggregates_match_incremental(self):
+        """Test that aggregates built on load match ones built by add()."""
+        entries = []
+        for i in range(40):
+            metadata = EvidenceMetadata.create(
+                filename=f"test_{i}.wav",
+                duration_seconds=1.5 * i,
+                sample_rate=44100,
+                channels=2,
+                trigger_probability=0.88,
+                peak_probability=0.5 + i / 100,
+                bark_count=i % 4,
+                microphone_name="Test Mic",
+            )
+            metadata.timestamp_utc = datetime(2026, 1, 5, tzinfo=timezone.utc) + timedelta(
+                hours=3 * i, minutes=i
+            )
+            entries.append(metadata)
+
+        incremental = EvidenceIndex()
+        for metadata in entries:
+            incremental.add(metadata)
+        loaded = EvidenceIndex(entries=list(entries))
+
+        start, end = date(2026, 1, 1), date(2026, 2, 1)
+        expected = incremental.get_daily_aggregates(start, end)
+        actual = loaded.get_daily_aggregates(start, end)
+        assert len(actual) == len(expected)
+        for got, want in zip(actual, expected):
+            assert got.total_barks == want.total_barks
+            assert got.total_events == want.total_events
+            assert got.total_duration == pytest.approx(want.total_duration)
+            assert got.confidence_sum == pytest.approx(want.confidence_sum)
+            assert got.hourly == want.hourly
+            assert got.local_daily == want.local_daily
+
+    def test_daily_aggregates(self):
+        """Test per-day aggregates track added and replaced entries."""
+        index = EvidenceIndex()
+
+        for day, bark_count in [(5, 2), (5, 3), (7, 4)]:
+            metadata = EvidenceMetadata.create(
+                filename=f"test_{day}_{bark_count}.wav",
+                duration_seconds=10.0,
+                sample_rate=44100,
+                channels=2,
+                trigger_probability=0.88,
+                peak_probability=0.9,
+                bark_count=bark_count,
+                microphone_name="Test Mic",
+            )
+            metadata.timestamp_utc = datetime(2026, 1, day, 12, 0, tzinfo=timezone.utc)
+            index.add(metadata)
+
+        days = index.get_daily_aggregates(date(2026, 1, 5), date(2026, 1, 8))
+        assert [d.total_barks for d in days] == [5, 4]
+        assert days[0].total_events == 2
+        assert days[0].total_duration == 20.0
+
+        assert index.get_daily_aggregates(date(2026, 1, 6), date(2026, 1, 7)) == []
+
+        index.replace_entries(index.entries[2:])
+        days = index.get_daily_aggregates(date(2026, 1, 5), date(2026, 1, 8))
+        assert [d.total_barks for d in days] == [4]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -13,6 +13,7 @@ from woofalytics.fingerprint.clustering import (
     is_clustering_available,
 )
 from woofalytics.fingerprint.models import BarkFingerprint, DogProfile
+from woofalytics.fingerprint.storage import CLUSTERER_MODEL_FILENAME
 
 
 class TestIsClusteringAvailable:
@@ -211,6 +212,32 @@ class TestBarkClustererWithHDBSCAN:
         # Should find at least one cluster (exact count depends on HDBSCAN)
         assert len(suggestions) >= 1
 
+    def test_cluster_untagged_reuses_persisted_model(self, tmp_path):
+        """Test that a saved model assigns new barks without refitting."""
+        from woofalytics.fingerprint.clustering import create_clusterer, hdbscan
+
+        mock_store = MagicMock()
+        fps = [
+            _make_fingerprint(f"c{d}_{i}", _make_embedding(direction=d))
+            for d in range(2)
+            for i in range(6)
+        ]
+        mock_store.get_untagged_fingerprints.return_value = fps
+
+        model_path = tmp_path / CLUSTERER_MODEL_FILENAME
+        first = create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+        assert model_path.exists()
+
+        # One new bark near the first cluster
+        new_fp = _make_fingerprint("new", _make_embedding(direction=0))
+        mock_store.get_untagged_fingerprints.return_value = [*fps, new_fp]
+
+        with patch.object(hdbscan.HDBSCAN, "fit_predict") as fit_predict:
+            second = create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        fit_predict.assert_not_called()
+        assert {s.cluster_id for s in second} == {s.cluster_id for s in first}
+
     def test_create_dog_from_cluster(self):
         """Test creating a dog profile from a cluster."""
         from woofalytics.fingerprint.clustering import create_clusterer
@@ -274,6 +301,108 @@ class TestBarkClustererWithHDBSCAN:
         assert samples[0] == "fp1"
 
 
+@pytest.mark.skipif(
+    not is_clustering_available(),
+    reason="hdbscan not installed",
+)
+class TestClusteringModelPersistence:
+    """Tests for reusing a persisted clustering model between runs."""
+
+    def _two_clusters(self) -> list[BarkFingerprint]:
+        return [
+            _make_fingerprint(f"c{d}_{i}", _make_embedding(direction=d))
+            for d in (0, 1)
+            for i in range(5)
+        ]
+
+    def test_model_saved_without_pickle(self, tmp_path):
+        """Test the model file holds plain arrays that load with allow_pickle=False."""
+        from woofalytics.fingerprint.clustering import create_clusterer
+
+        model_path = tmp_path / CLUSTERER_MODEL_FILENAME
+        mock_store = MagicMock()
+        mock_store.get_untagged_fingerprints.return_value = self._two_clusters()
+
+        create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        with np.load(model_path, allow_pickle=False) as data:
+            assert set(data.files) == {
+                "params", "ids", "embeddings", "labels", "probabilities", "reach"
+            }
+            assert len(data["ids"]) == 10
+
+    def test_new_bark_joins_nearest_cluster(self, tmp_path):
+        """Test a new bark is placed into a persisted cluster without refitting."""
+        from woofalytics.fingerprint.clustering import create_clusterer
+
+        model_path = tmp_path / CLUSTERER_MODEL_FILENAME
+        fingerprints = self._two_clusters()
+        mock_store = MagicMock()
+        mock_store.get_untagged_fingerprints.return_value = fingerprints
+        create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        new_fp = _make_fingerprint("new", fingerprints[0].embedding.copy())
+        mock_store.get_untagged_fingerprints.return_value = [*fingerprints, new_fp]
+        with patch("woofalytics.fingerprint.clustering.hdbscan.HDBSCAN") as hdbscan_cls:
+            suggestions = create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        hdbscan_cls.assert_not_called()
+        cluster = next(s for s in suggestions if "c0_0" in s.fingerprint_ids)
+        assert "new" in cluster.fingerprint_ids
+
+    def test_reach_saved_at_fit_not_recomputed(self, tmp_path):
+        """Test cluster reach is computed once at fit time, not on each reuse."""
+        from woofalytics.fingerprint.clustering import create_clusterer
+
+        model_path = tmp_path / CLUSTERER_MODEL_FILENAME
+        fingerprints = self._two_clusters()
+        mock_store = MagicMock()
+        mock_store.get_untagged_fingerprints.return_value = fingerprints
+        create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        mock_store.get_untagged_fingerprints.return_value = [
+            *fingerprints,
+            _make_fingerprint("new", _make_embedding(direction=0)),
+        ]
+        with patch("woofalytics.fingerprint.clustering._cluster_reach") as cluster_reach:
+            create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        cluster_reach.assert_not_called()
+
+    def test_cluster_reach_matches_brute_force(self):
+        """Test the chunked reach equals the full pairwise computation."""
+        from woofalytics.fingerprint.clustering import _cluster_reach
+
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(40, 8))
+        labels = np.array([0] * 15 + [1] * 20 + [-1] * 5)
+
+        reach = _cluster_reach(embeddings, labels, chunk_size=4)
+
+        for label in (0, 1):
+            members = embeddings[labels == label]
+            dists = np.linalg.norm(members[:, None] - members[None, :], axis=-1)
+            np.fill_diagonal(dists, np.inf)
+            assert reach[label] == pytest.approx(dists.min(axis=1).max())
+
+    def test_pickled_model_file_is_ignored(self, tmp_path):
+        """Test a pickle in place of the model is not unpickled, just refit over."""
+        import pickle
+
+        from woofalytics.fingerprint.clustering import create_clusterer
+
+        model_path = tmp_path / CLUSTERER_MODEL_FILENAME
+        model_path.write_bytes(pickle.dumps({"params": (3, 2)}))
+        mock_store = MagicMock()
+        mock_store.get_untagged_fingerprints.return_value = self._two_clusters()
+
+        suggestions = create_clusterer(mock_store, model_path=model_path).cluster_untagged()
+
+        assert len(suggestions) == 2
+        with np.load(model_path, allow_pickle=False) as data:
+            assert len(data["ids"]) == 10
+
+
 class TestClusteringUnavailable:
     """Tests for when hdbscan is not installed."""
 
@@ -192,6 +192,35 @@ class TestDogProfile:
         assert dog.embedding[0] > 0
         assert dog.embedding[1] > 0
 
+    def test_update_embedding_batch(self):
+        """Test that a batch update matches per-sample updates exactly."""
+        batch = np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        dog = DogProfile(id="dog123", name="Buddy")
+        dog.update_embedding(np.array([1.0, 0.0, 0.0]))
+        sequential = DogProfile(id="dog456", name="Rex")
+        sequential.update_embedding(np.array([1.0, 0.0, 0.0]))
+
+        dog.update_embedding_batch(batch)
+        for sample in batch:
+            sequential.update_embedding(sample)
+
+        assert dog.sample_count == 3
+        np.testing.assert_array_equal(dog.embedding, sequential.embedding)
+        # Re-normalizing after each sample is not a plain mean of all three:
+        # (1, 0, 0) -> (1, 1, 0) / sqrt(2) -> (sqrt(2), sqrt(2), 1) / sqrt(5)
+        np.testing.assert_almost_equal(
+            dog.embedding, np.array([np.sqrt(2), np.sqrt(2), 1.0]) / np.sqrt(5)
+        )
+
+    def test_update_embedding_batch_empty(self):
+        """Test that an empty batch leaves the profile untouched."""
+        dog = DogProfile(id="dog123", name="Buddy")
+
+        dog.update_embedding_batch(np.empty((0, 3)))
+
+        assert dog.sample_count == 0
+        assert dog.embedding is None
+
 
 class TestEmbeddingQualityGate:
     """Tests for embedding quality gate threshold."""
@@ -0,0 +1,156 @@
+"""Tests for fingerprint SQLite storage."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+from woofalytics.fingerprint.models import BarkFingerprint
+from woofalytics.fingerprint.storage import FingerprintStore
+
+
+class TestConnectionSettings:
+    """Tests for SQLite connection tuning."""
+
+    def test_database_uses_wal(self, tmp_path: Path):
+        """Test that the store switches the database to WAL journaling."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+
+        with store._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_connection_pragmas_applied(self, tmp_path: Path):
+        """Test that each connection gets the read-tuning pragmas."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+
+        with store._get_connection() as conn:
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
+
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+
+    def test_acoustic_aggregates_use_dog_timestamp_index(self, tmp_path: Path):
+        """Test that the per-dog join probes the existing (dog_id, timestamp) index."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+
+        with store._get_connection() as conn:
+            indexes = {
+                row["name"]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            plan = " ".join(
+                row["detail"]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT d.id, COUNT(f.id) FROM dog_profiles d "
+                    "LEFT JOIN bark_fingerprints f "
+                    "ON d.id = f.dog_id AND f.rejection_reason IS NULL "
+                    "GROUP BY d.id, d.name"
+                )
+            )
+
+        assert "idx_fingerprints_dog_rejection" not in indexes
+        assert "idx_fingerprints_dog_timestamp" in plan
+
+
+class TestDogStatsBatch:
+    """Tests for batched dog profile updates."""
+
+    def test_batch_matches_sequential_updates(self, tmp_path: Path):
+        """Test that a batch update gives the same profile as one-at-a-time updates."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+        batch_dog = store.create_dog(name="Batch")
+        seq_dog = store.create_dog(name="Sequential")
+
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(6, 512)).astype(np.float32)
+        start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        timestamps = [start + timedelta(minutes=i) for i in range(6)]
+
+        store.update_dog_stats_batch(batch_dog.id, embeddings, timestamps)
+        for embedding, timestamp in zip(embeddings, timestamps):
+            store.update_dog_stats(seq_dog.id, embedding, timestamp)
+
+        batched = store.get_dog(batch_dog.id)
+        sequential = store.get_dog(seq_dog.id)
+        assert batched.sample_count == sequential.sample_count == 6
+        # Only float16 storage rounding between sequential writes differs
+        np.testing.assert_allclose(batched.embedding, sequential.embedding, atol=2e-3)
+
+
+class TestFilterUntaggedIds:
+    """Tests for re-checking cached fingerprint IDs."""
+
+    def test_drops_tagged_rejected_and_missing(self, tmp_path: Path):
+        """Test only still-untagged fingerprints are kept, in input order."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+        dog = store.create_dog(name="Rex")
+        for fp_id in ("fp-a", "fp-b", "fp-c", "fp-d"):
+            store.save_fingerprint(BarkFingerprint(id=fp_id, timestamp=datetime.now(timezone.utc)))
+
+        store.tag_fingerprint("fp-b", dog.id, confidence=0.9)
+        store.reject_fingerprint("fp-c", reason="not a bark")
+
+        ids = ["fp-d", "fp-b", "fp-c", "fp-missing", "fp-a"]
+        assert store.filter_untagged_ids(ids) == ["fp-d", "fp-a"]
+        assert store.filter_untagged_ids([]) == []
+
+
+class TestClustererModelInvalidation:
+    """Tests for discarding the persisted clustering model."""
+
+    def test_model_deleted_when_labelled_data_changes(self, tmp_path: Path):
+        """Test untagging, merging and purging delete the persisted model."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+        rex = store.create_dog(name="Rex")
+        fido = store.create_dog(name="Fido")
+        store.save_fingerprint(
+            BarkFingerprint(id="fp-a", timestamp=datetime.now(timezone.utc), dog_id=rex.id)
+        )
+        model_path = store.clusterer_model_path
+        assert model_path.parent == tmp_path
+
+        changes = [
+            lambda: store.untag_fingerprint("fp-a"),
+            lambda: store.merge_dogs(fido.id, rex.id),
+            lambda: store.purge_fingerprints(before=datetime.now(timezone.utc) + timedelta(days=1)),
+            lambda: store.purge_all_fingerprints(),
+        ]
+        for change in changes:
+            store.save_fingerprint(
+                BarkFingerprint(id="fp-a", timestamp=datetime.now(timezone.utc), dog_id=rex.id)
+            )
+            model_path.write_bytes(b"model")
+            change()
+            assert not model_path.exists()
+
+
+class TestListingTotals:
+    """Tests for listing totals counted separately from the page."""
+
+    def test_totals_count_beyond_the_page(self, tmp_path: Path):
+        """Test totals include rows outside the returned page."""
+        store = FingerprintStore(tmp_path / "fingerprints.db")
+        dog = store.create_dog(name="Rex")
+        start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        for i in range(6):
+            store.save_fingerprint(
+                BarkFingerprint(
+                    id=f"fp-{i}",
+                    timestamp=start + timedelta(minutes=i),
+                    dog_id=dog.id if i < 2 else None,
+                )
+            )
+        store.reject_fingerprint("fp-5", reason="wind")
+
+        untagged, total_untagged = store.list_untagged_fingerprints(limit=2)
+        assert [fp.id for fp in untagged] == ["fp-4", "fp-3"]
+        assert total_untagged == 3
+
+        page, total = store.list_fingerprints(limit=2, offset=10)
+        assert page == []
+        assert total == 6
@@ -5,11 +5,13 @@ Tests cover daily, weekly, and monthly summary functionality.
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Generator
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -24,10 +26,13 @@ from woofalytics.config import (
     WebhookConfig,
 )
 from woofalytics.evidence.metadata import (
+    EvidenceIndex,
     EvidenceMetadata,
     DetectionInfo,
     DeviceInfo,
 )
+from woofalytics.evidence.storage import EvidenceStorage
+from woofalytics.fingerprint.storage import FingerprintStore
 
 
 @pytest.fixture
@@ -90,9 +95,9 @@ def create_mock_entry(
 
 
 @pytest.fixture
-def mock_evidence_with_entries() -> MagicMock:
-    """Create a mock EvidenceStorage with entries across multiple days."""
-    evidence = MagicMock()
+def mock_evidence_with_entries(api_settings: Settings) -> EvidenceStorage:
+    """Create an EvidenceStorage with entries across multiple days."""
+    evidence = EvidenceStorage(config=api_settings.evidence, audio_capture=MagicMock())
 
     # Create test entries spanning multiple days
     # Base time: Monday 2026-01-05 12:00 UTC
@@ -139,19 +144,15 @@ def mock_evidence_with_entries() -> MagicMock:
         ),
     ]
 
-    evidence._index = MagicMock()
-    evidence._index.entries = entries
+    evidence._index = EvidenceIndex(entries=entries)
 
     return evidence
 
 
 @pytest.fixture
-def mock_empty_evidence() -> MagicMock:
-    """Create a mock EvidenceStorage with no entries."""
-    evidence = MagicMock()
-    evidence._index = MagicMock()
-    evidence._index.entries = []
-    return evidence
+def mock_empty_evidence(api_settings: Settings) -> EvidenceStorage:
+    """Create an EvidenceStorage with no entries."""
+    return EvidenceStorage(config=api_settings.evidence, audio_capture=MagicMock())
 
 
 @pytest.fixture
@@ -176,7 +177,7 @@ def mock_fingerprint_store() -> MagicMock:
 def summary_client(
     api_settings: Settings,
     mock_detector: MagicMock,
-    mock_evidence_with_entries: MagicMock,
+    mock_evidence_with_entries: EvidenceStorage,
     mock_fingerprint_store: MagicMock,
 ) -> Generator[TestClient, None, None]:
     """Create a test client for summary testing."""
@@ -205,7 +206,7 @@ def summary_client(
 def empty_summary_client(
     api_settings: Settings,
     mock_detector: MagicMock,
-    mock_empty_evidence: MagicMock,
+    mock_empty_evidence: EvidenceStorage,
     mock_fingerprint_store: MagicMock,
 ) -> Generator[TestClient, None, None]:
     """Create a test client with empty evidence."""
@@ -291,6 +292,14 @@ class TestDailySummary:
         assert response.status_code == 400
         assert "Invalid date format" in response.json()["detail"]
 
+    @pytest.mark.parametrize("date", ["2026-02-30", "2026-1-05", "2026-01-5x", "20260105"])
+    def test_daily_summary_rejects_malformed_date(
+        self, summary_client: TestClient, date: str
+    ) -> None:
+        """Test daily summary rejects impossible and malformed dates."""
+        response = summary_client.get(f"/api/summary/daily?date={date}")
+        assert response.status_code == 400
+
     def test_daily_summary_empty_evidence(
         self, empty_summary_client: TestClient
     ) -> None:
@@ -333,6 +342,16 @@ class TestWeeklySummary:
         # Wednesday: 3
         assert daily["2026-01-07"] == 3
 
+    def test_weekly_summary_daily_breakdown_is_chronological(
+        self, summary_client: TestClient
+    ) -> None:
+        """Test daily breakdown keys come back in date order."""
+        response = summary_client.get("/api/summary/weekly?date=2026-01-05")
+        assert response.status_code == 200
+
+        days = list(response.json()["daily_breakdown"])
+        assert days == sorted(days)
+
     def test_weekly_summary_week_boundaries(self, summary_client: TestClient) -> None:
         """Test weekly summary has correct week boundaries."""
         response = summary_client.get("/api/summary/weekly?date=2026-01-07")
@@ -399,6 +418,14 @@ class TestMonthlySummary:
         assert response.status_code == 400
         assert "Invalid month format" in response.json()["detail"]
 
+    @pytest.mark.parametrize("month", ["2026-13", "2026-1", "2026/01", "+026-01"])
+    def test_monthly_summary_rejects_malformed_month(
+        self, summary_client: TestClient, month: str
+    ) -> None:
+        """Test monthly summary rejects out-of-range and malformed months."""
+        response = summary_client.get(f"/api/summary/monthly?month={month}")
+        assert response.status_code == 400
+
     def test_monthly_summary_empty_evidence(
         self, empty_summary_client: TestClient
     ) -> None:
@@ -409,3 +436,367 @@ class TestMonthlySummary:
         data = response.json()
         assert data["total_barks"] == 0
         assert data["total_events"] == 0
+
+
+class TestRangeSummary:
+    """Tests for custom date range summary endpoint."""
+
+    def test_range_summary_returns_stats_and_breakdowns(
+        self, summary_client: TestClient
+    ) -> None:
+        """Test range summary combines totals, daily and hourly breakdowns."""
+        response = summary_client.get(
+            "/api/summary/range?start_date=2026-01-05&end_date=2026-01-06"
+        )
+        assert response.status_code == 200
+
+        data = response.json()
+        # Monday (5 + 3 + 4) and Tuesday (2 + 6)
+        assert data["total_barks"] == 20
+        assert data["total_events"] == 5
+        assert data["daily_breakdown"] == {"2026-01-05": 12, "2026-01-06": 8}
+        assert sum(data["hourly_breakdown"].values()) == 20
+
+
+class TestSummaryConditionalRequests:
+    """Tests for ETag support on summary endpoints."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/summary/daily?date=2026-01-05",
+            "/api/summary/weekly?date=2026-01-05",
+            "/api/summary/monthly?month=2026-01",
+        ],
+    )
+    def test_matching_etag_returns_304(self, summary_client: TestClient, path: str) -> None:
+        """Test that an unchanged summary is not sent again."""
+        first = summary_client.get(path)
+        etag = first.headers["ETag"]
+
+        second = summary_client.get(path, headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.content == b""
+
+    def test_etag_differs_per_period(self, summary_client: TestClient) -> None:
+        """Test that different periods get different ETags."""
+        monday = summary_client.get("/api/summary/daily?date=2026-01-05")
+        tuesday = summary_client.get("/api/summary/daily?date=2026-01-06")
+
+        assert monday.headers["ETag"] != tuesday.headers["ETag"]
+
+    def test_new_evidence_changes_etag(
+        self,
+        summary_client: TestClient,
+        mock_evidence_with_entries: EvidenceStorage,
+    ) -> None:
+        """Test that adding evidence invalidates the previous ETag."""
+        first = summary_client.get("/api/summary/daily?date=2026-01-05")
+        etag = first.headers["ETag"]
+
+        mock_evidence_with_entries._index.add(
+            create_mock_entry(
+                datetime(2026, 1, 5, 20, 0, tzinfo=timezone.utc),
+                bark_count=7,
+                filename="bark_mon_20.wav",
+            )
+        )
+        second = summary_client.get(
+            "/api/summary/daily?date=2026-01-05", headers={"If-None-Match": etag}
+        )
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != etag
+        assert second.json()["total_barks"] == 19
+
+    def test_utc_offset_changes_etag(self, summary_client: TestClient) -> None:
+        """Test that a different local UTC offset invalidates the previous ETag."""
+        path = "/api/summary/daily?date=2026-01-05"
+        etag = summary_client.get(path).headers["ETag"]
+
+        other_tz = timezone(timedelta(hours=5, minutes=30))
+        with patch("woofalytics.api.routes_summary.LOCAL_TZ", other_tz):
+            second = summary_client.get(path, headers={"If-None-Match": etag})
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != etag
+
+    def test_etag_version_changes_etag(self, summary_client: TestClient) -> None:
+        """Test that bumping the ETag version invalidates the previous ETag."""
+        path = "/api/summary/daily?date=2026-01-05"
+        etag = summary_client.get(path).headers["ETag"]
+
+        with patch("woofalytics.api.routes_summary.SUMMARY_ETAG_VERSION", "test"):
+            second = summary_client.get(path, headers={"If-None-Match": etag})
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != etag
+
+
+def _fake_llm_prompt(**kwargs: object) -> str:
+    """Stand in for the prompty template, keeping prompts data-dependent."""
+    return repr(sorted(kwargs.items()))
+
+
+@pytest.fixture
+def ai_client(
+    tmp_path: Path,
+    api_settings: Settings,
+    mock_detector: MagicMock,
+    mock_evidence_with_entries: EvidenceStorage,
+) -> Generator[TestClient, None, None]:
+    """Create a test client backed by a real fingerprint store."""
+    from woofalytics.api.routes import router
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.state.settings = api_settings
+    app.state.detector = mock_detector
+    app.state.evidence = mock_evidence_with_entries
+    app.state.fingerprint_store = FingerprintStore(tmp_path / "fingerprints.db")
+    app.state.ollama_client = MagicMock()
+
+    with TestClient(app) as client:
+        yield client
+
+
+@patch("woofalytics.api.routes_summary._format_llm_prompt", _fake_llm_prompt)
+class TestAISummaryCache:
+    """Tests for reuse of generated AI summaries."""
+
+    def test_repeat_request_served_from_cache(self, ai_client: TestClient) -> None:
+        """Test that an identical period does not call the LLM twice."""
+        call_ollama = AsyncMock(return_value=("A quiet week.", 1234))
+        with patch("woofalytics.api.routes_summary._call_ollama", call_ollama):
+            first = ai_client.get("/api/summary/weekly/ai?date=2026-01-15")
+            second = ai_client.get("/api/summary/weekly/ai?date=2026-01-15")
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert call_ollama.await_count == 1
+        assert first.json()["generation_time_ms"] == 1234
+        assert second.json()["summary"] == "A quiet week."
+        assert second.json()["generation_time_ms"] == 0
+
+    def test_refresh_regenerates_and_replaces(self, ai_client: TestClient) -> None:
+        """Test that refresh bypasses the cache and stores the new summary."""
+        call_ollama = AsyncMock(side_effect=[("First.", 100), ("Second.", 200)])
+        with patch("woofalytics.api.routes_summary._call_ollama", call_ollama):
+            ai_client.get("/api/summary/weekly/ai?date=2026-01-15")
+            refreshed = ai_client.get("/api/summary/weekly/ai?date=2026-01-15&refresh=true")
+            cached = ai_client.get("/api/summary/weekly/ai?date=2026-01-15")
+
+        assert call_ollama.await_count == 2
+        assert refreshed.json()["summary"] == "Second."
+        assert cached.json()["summary"] == "Second."
+        assert cached.json()["generation_time_ms"] == 0
+
+    def test_different_period_not_shared(self, ai_client: TestClient) -> None:
+        """Test that a period with different data generates a new summary."""
+        call_ollama = AsyncMock(return_value=("Summary.", 100))
+        with patch("woofalytics.api.routes_summary._call_ollama", call_ollama):
+            ai_client.get("/api/summary/weekly/ai?date=2026-01-15")
+            ai_client.get("/api/summary/weekly/ai?date=2026-01-22")
+
+        assert call_ollama.await_count == 2
+
+
+class TestFormatDayName:
+    """Tests for the cached day-name formatter used in AI prompts."""
+
+    def test_formats_iso_date(self) -> None:
+        """Test that ISO dates become weekday and month names."""
+        from woofalytics.api.routes_summary import _format_day_name
+
+        assert _format_day_name("2026-01-05") == "Monday, January 05"
+
+    def test_unparseable_key_passed_through(self) -> None:
+        """Test that a non-date key is returned unchanged."""
+        from woofalytics.api.routes_summary import _format_day_name
+
+        assert _format_day_name("unknown") == "unknown"
+
+
+def _sse_payloads(body: str) -> list[dict]:
+    """Decode the JSON payloads of a Server-Sent Events body."""
+    return [
+        json.loads(line.removeprefix("data: "))
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@patch("woofalytics.api.routes_summary._format_llm_prompt", _fake_llm_prompt)
+class TestWeeklyAIStream:
+    """Tests for the streaming weekly AI summary endpoint."""
+
+    @staticmethod
+    def _ollama_client(lines: list[dict]) -> httpx.AsyncClient:
+        """Create a client whose transport replays an Ollama NDJSON stream."""
+        body = "".join(json.dumps(line) + "\n" for line in lines)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, text=body)
+
+        return httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+
+    def test_streams_tokens_then_metadata(self, ai_client: TestClient) -> None:
+        """Test that generated tokens arrive as events before the summary metadata."""
+        ai_client.app.state.ollama_client = self._ollama_client([
+            {"response": "A quiet", "done": False},
+            {"response": " week.", "done": False},
+            {"response": "", "done": True},
+        ])
+
+        response = ai_client.get("/api/summary/weekly/ai/stream?date=2026-01-05")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _sse_payloads(response.text)
+        assert [e["token"] for e in events[:-1]] == ["A quiet", " week."]
+        assert events[-1]["done"] is True
+        assert events[-1]["data_period"] == "2026-01-05 to 2026-01-11"
+
+    def test_completed_stream_is_cached(self, ai_client: TestClient) -> None:
+        """Test that a streamed summary is reused by later requests."""
+        ai_client.app.state.ollama_client = self._ollama_client([
+            {"response": "Cached summary.", "done": True},
+        ])
+        ai_client.get("/api/summary/weekly/ai/stream?date=2026-01-05")
+
+        call_ollama = AsyncMock()
+        with patch("woofalytics.api.routes_summary._call_ollama", call_ollama):
+            response = ai_client.get("/api/summary/weekly/ai?date=2026-01-05")
+
+        call_ollama.assert_not_awaited()
+        assert response.json()["summary"] == "Cached summary."
+        assert response.json()["generation_time_ms"] == 0
+
+    def test_ollama_unavailable_returns_503(self, ai_client: TestClient) -> None:
+        """Test that a connection failure is reported before streaming starts."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        ai_client.app.state.ollama_client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+
+        response = ai_client.get("/api/summary/weekly/ai/stream?date=2026-01-05")
+
+        assert response.status_code == 503
+
+
+class TestPerDogBarkCounts:
+    """Tests for per-dog counts served from the daily rollup."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> FingerprintStore:
+        """Create an empty fingerprint store."""
+        return FingerprintStore(tmp_path / "fingerprints.db")
+
+    @staticmethod
+    def _counts(store: FingerprintStore, start: datetime, end: datetime) -> dict[str, int]:
+        from woofalytics.api.routes_summary import _get_per_dog_bark_counts
+
+        return {
+            item.dog_name: item.bark_count
+            for item in _get_per_dog_bark_counts(store, start, end)
+        }
+
+    def test_rollup_tracks_fingerprint_changes(self, store: FingerprintStore) -> None:
+        """Test that inserts, tagging, re-saves and deletes keep counts exact."""
+        from woofalytics.fingerprint.models import BarkFingerprint
+
+        rex = store.create_dog(name="Rex")
+        fido = store.create_dog(name="Fido")
+        store.confirm_dog(rex.id, min_samples=1)
+        store.confirm_dog(fido.id, min_samples=1)
+
+        monday = datetime(2026, 1, 5, 12, 0, tzinfo=timezone.utc)
+        fps = [
+            BarkFingerprint(timestamp=monday + timedelta(days=i % 2), dog_id=rex.id)
+            for i in range(4)
+        ]
+        untagged = BarkFingerprint(timestamp=monday)
+        for fp in [*fps, untagged]:
+            store.save_fingerprint(fp)
+
+        week = (
+            datetime(2026, 1, 5, tzinfo=timezone.utc),
+            datetime(2026, 1, 12, tzinfo=timezone.utc),
+        )
+        assert self._counts(store, *week) == {"Rex": 4}
+
+        store.tag_fingerprint(untagged.id, fido.id, 0.9)
+        store.untag_fingerprint(fps[0].id)
+        store.save_fingerprint(fps[1])  # INSERT OR REPLACE of an existing row
+        store.delete_fingerprint(fps[2].id)
+        assert self._counts(store, *week) == {"Rex": 2, "Fido": 1}
+
+        # Only Monday
+        assert self._counts(store, week[0], week[0] + timedelta(days=1)) == {"Fido": 1}
+
+    def test_unconfirmed_dogs_excluded(self, store: FingerprintStore) -> None:
+        """Test that barks of unconfirmed dogs are not reported."""
+        from woofalytics.fingerprint.models import BarkFingerprint
+
+        dog = store.create_dog(name="Stray")
+        store.save_fingerprint(
+            BarkFingerprint(timestamp=datetime(2026, 1, 5, tzinfo=timezone.utc), dog_id=dog.id)
+        )
+
+        start = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        assert self._counts(store, start, start + timedelta(days=1)) == {}
+
+    def test_query_uses_rollup_index(self, store: FingerprintStore) -> None:
+        """Test that the per-dog query is served by the covering rollup index."""
+        from woofalytics.api.routes_summary import _PER_DOG_BARK_COUNTS_SQL
+
+        with store._get_connection() as conn:
+            plan = " ".join(
+                row["detail"]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN " + _PER_DOG_BARK_COUNTS_SQL, ("2026-01-05", "2026-01-12")
+                )
+            )
+
+        assert "idx_rollup_dog_day" in plan
+        assert "bark_fingerprints" not in plan
+
+
+class TestWeeklyPromptTemplate:
+    """Tests for the compiled weekly summary prompt template."""
+
+    def test_template_compiled_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the prompt body is compiled once and reused."""
+        from types import SimpleNamespace
+
+        from woofalytics.api import routes_summary
+
+        load = MagicMock(
+            return_value=SimpleNamespace(content="{{ week_start }}: {{ total_barks }} barks")
+        )
+        monkeypatch.setattr(routes_summary, "_weekly_summary_template", None)
+        monkeypatch.setattr(routes_summary, "_get_weekly_summary_prompty", load)
+
+        kwargs = dict(
+            start_display="January 05",
+            end_display="January 11, 2026",
+            total_events=6,
+            total_duration_seconds=30.0,
+            avg_confidence=0.9,
+            peak_hour=14,
+            daily_breakdown={},
+            per_dog_counts=[],
+        )
+        first = routes_summary._format_llm_prompt(total_barks=23, **kwargs)
+        second = routes_summary._format_llm_prompt(total_barks=7, **kwargs)
+
+        assert first == "January 05: 23 barks"
+        assert second == "January 05: 7 barks"
+        load.assert_called_once()